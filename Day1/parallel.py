@@ -0,0 +1,241 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Advent Of Code 2025
+===================
+Day : 1
+Part : 1 & 2 (mode multi-processus)
+
+Ce script calcule les "passwords" des parties 1 et 2 en répartissant
+le fichier de rotations sur plusieurs processus.
+
+La simulation dépend de la position courante, mais le cadran n'a que MOD
+états possibles. Un bloc de rotations peut donc être résumé par une table
+indexée par la position de départ s (0..MOD-1) :
+    - ends[s]   : position d'arrivée,
+    - hits[s]   : arrêts exacts sur 0 (partie 1),
+    - passes[s] : passages sur 0 (partie 2).
+
+Deux résumés consécutifs A puis B se composent :
+    ends[s]   = B.ends[A.ends[s]]
+    hits[s]   = A.hits[s]   + B.hits[A.ends[s]]
+    passes[s] = A.passes[s] + B.passes[A.ends[s]]
+
+Chaque résumé est construit en une seule passe sur le bloc, quel que soit
+MOD, grâce à un histogramme (partie 1) et un tableau de différences
+(partie 2). Le fichier est découpé en plages d'octets alignées sur les fins
+de ligne, résumées en parallèle puis composées dans l'ordre.
+
+.. codeauthor:: Alexandre Condette <alexandre.condette@wanadoo.fr>
+"""
+
+# %% ========================================================================
+# Imports
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple
+# ===========================================================================
+
+# %% ========================================================================
+# Constantes
+MOD: int = 100                     # Taille du module (0..99)
+SIGNS: dict = {"R": 1, "L": -1}    # Mapping direction → signe
+START: int = 50                    # Position initiale
+CHUNK_SIZE: int = 1 << 24          # Taille cible d'un bloc (octets)
+
+# Mapping octet de direction → signe (lecture directe des bytes)
+BYTE_SIGNS: dict = {ord(k): v for k, v in SIGNS.items()}
+
+# ===========================================================================
+
+# %% ========================================================================
+# Résumés de blocs
+class ChunkSummary(NamedTuple):
+    """
+    Résumé d'un bloc de rotations, indexé par la position de départ.
+    """
+    ends: list
+    hits: list
+    passes: list
+
+# ---------------------------------------------------------------------------
+def identity() -> ChunkSummary:
+    """
+    Résumé d'un bloc vide : le cadran ne bouge pas et ne compte rien.
+
+    :return: résumé neutre pour la composition
+    :rtype: ChunkSummary
+    """
+    return ChunkSummary(list(range(MOD)), [0] * MOD, [0] * MOD)
+
+# ---------------------------------------------------------------------------
+def summarize(movements) -> ChunkSummary:
+    """
+    Construit le résumé d'une séquence de mouvements signés.
+
+    Partant de s, un mouvement m effectué depuis l'offset q (somme des
+    mouvements précédents modulo MOD) :
+        - s'arrête sur 0 si s ≡ -(q + m) → histogramme des offsets,
+        - passe |m| // MOD fois sur 0 quoi qu'il arrive, plus une fois si
+          le reste r = |m| % MOD atteint le prochain 0 dans le sens du
+          mouvement ; cette condition vaut pour un intervalle circulaire
+          de r positions de départ → tableau de différences.
+
+    :param movements: itérable de mouvements signés, ex. [10, -5]
+    :return: résumé du bloc
+    :rtype: ChunkSummary
+    """
+    hits = [0] * MOD
+    diff = [0] * (MOD + 1)
+    base = 0
+    offset = 0
+
+    for movement in movements:
+        turns, rest = divmod(abs(movement), MOD)
+        base += turns
+
+        if rest:
+            # Premier départ s (circulaire) pour lequel le reste atteint 0
+            if movement > 0:
+                first = (MOD - rest - offset) % MOD
+            else:
+                first = (1 - offset) % MOD
+
+            last = first + rest
+            diff[first] += 1
+            if last <= MOD:
+                diff[last] -= 1
+            else:
+                diff[MOD] -= 1
+                diff[0] += 1
+                diff[last - MOD] -= 1
+
+        offset = (offset + movement) % MOD
+        hits[-offset % MOD] += 1
+
+    passes = []
+    running = base
+    for s in range(MOD):
+        running += diff[s]
+        passes.append(running)
+
+    ends = [(s + offset) % MOD for s in range(MOD)]
+
+    return ChunkSummary(ends, hits, passes)
+
+# ---------------------------------------------------------------------------
+def combine(first: ChunkSummary, second: ChunkSummary) -> ChunkSummary:
+    """
+    Compose deux résumés consécutifs (first puis second).
+
+    :param first: résumé du bloc précédent
+    :param second: résumé du bloc suivant
+    :return: résumé de la concaténation des deux blocs
+    :rtype: ChunkSummary
+    """
+    ends = [second.ends[e] for e in first.ends]
+    hits = [h + second.hits[e] for h, e in zip(first.hits, first.ends)]
+    passes = [p + second.passes[e] for p, e in zip(first.passes, first.ends)]
+
+    return ChunkSummary(ends, hits, passes)
+
+# ===========================================================================
+
+# %% ========================================================================
+# Lecture par plages d'octets
+def parse_movements(buffer: bytes):
+    """
+    Décode les rotations d'un buffer d'octets en mouvements signés.
+
+    :param buffer: contenu brut, ex. b"R10\\nL5\\n"
+    :return: générateur de mouvements signés
+    """
+    for line in buffer.split():
+        yield int(line[1:]) * BYTE_SIGNS[line[0]]
+
+# ---------------------------------------------------------------------------
+def split_ranges(path: str, chunk_size: int = CHUNK_SIZE) -> list:
+    """
+    Découpe un fichier en plages d'octets [start, stop) alignées sur les
+    fins de ligne, d'environ `chunk_size` octets chacune.
+
+    :param path: chemin du fichier de rotations
+    :param chunk_size: taille cible d'une plage
+    :return: liste de plages (start, stop)
+    :rtype: list
+    """
+    size = os.path.getsize(path)
+    ranges = []
+    start = 0
+
+    with open(path, 'rb') as f:
+        while start < size:
+            stop = min(start + chunk_size, size)
+            if stop < size:
+                # On avance jusqu'à la fin de la ligne en cours
+                f.seek(stop)
+                stop += len(f.readline())
+            ranges.append((start, stop))
+            start = stop
+
+    return ranges
+
+# ---------------------------------------------------------------------------
+def summarize_range(path: str, start: int, stop: int) -> ChunkSummary:
+    """
+    Résume la plage d'octets [start, stop) du fichier (exécuté par un worker).
+
+    :param path: chemin du fichier de rotations
+    :param start: premier octet de la plage
+    :param stop: octet suivant la fin de la plage
+    :return: résumé de la plage
+    :rtype: ChunkSummary
+    """
+    with open(path, 'rb') as f:
+        f.seek(start)
+        buffer = f.read(stop - start)
+
+    return summarize(parse_movements(buffer))
+
+# ===========================================================================
+
+# %% ========================================================================
+# Résolution
+def solve(path: str, workers: int = None, chunk_size: int = CHUNK_SIZE) -> tuple:
+    """
+    Calcule les passwords des parties 1 et 2 en parallèle.
+
+    :param path: chemin du fichier de rotations
+    :param workers: nombre de processus (par défaut : nombre de cœurs)
+    :param chunk_size: taille cible d'un bloc, en octets
+    :return: (password partie 1, password partie 2)
+    :rtype: tuple
+    """
+    ranges = split_ranges(path, chunk_size)
+    total = identity()
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        summaries = executor.map(summarize_range,
+                                 [path] * len(ranges),
+                                 [start for start, _ in ranges],
+                                 [stop for _, stop in ranges])
+
+        # Composition dans l'ordre du fichier
+        for summary in summaries:
+            total = combine(total, summary)
+
+    return total.hits[START], total.passes[START]
+
+# ===========================================================================
+
+# %%
+if __name__ == "__main__":
+    RESULT_1, RESULT_2 = solve("./Day1/input.txt")
+
+    print("\n" + "═" * 60)
+    print("   🔐 Advent of Code 2025 — Day 1 | Parallèle".center(60))
+    print("═" * 60)
+    print(f"Password (partie 1) : \033[96m{RESULT_1}\033[0m")
+    print(f"Password (partie 2) : \033[96m{RESULT_2}\033[0m")
+    print("═" * 60 + "\n")
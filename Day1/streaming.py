@@ -0,0 +1,121 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Advent Of Code 2025
+===================
+Day : 1
+Part : 1 & 2 (lecture en flux)
+
+Ce script calcule les "passwords" des parties 1 et 2 sans charger le
+fichier de rotations en mémoire :
+    - le fichier est projeté en mémoire (mmap),
+    - les enregistrements "R123\\n" / "L45\\n" sont décodés directement
+      depuis le buffer d'octets, sans créer de chaîne par ligne,
+    - les deux passwords sont mis à jour au fil de la lecture.
+
+La mémoire supplémentaire est constante : des fichiers plus gros que la
+RAM disponible peuvent être traités.
+
+.. codeauthor:: Alexandre Condette <alexandre.condette@wanadoo.fr>
+"""
+
+# %% ========================================================================
+# Imports
+import mmap
+import os
+# ===========================================================================
+
+# %% ========================================================================
+# Constantes
+MOD: int = 100                     # Taille du module (0..99)
+SIGNS: dict = {"R": 1, "L": -1}    # Mapping direction → signe
+START: int = 50                    # Position initiale
+
+# Mapping octet de direction → signe (lecture directe des bytes)
+BYTE_SIGNS: dict = {ord(k): v for k, v in SIGNS.items()}
+
+# ===========================================================================
+
+# %% ========================================================================
+# Lecture en flux
+def iter_movements(path: str):
+    """
+    Parcourt les rotations du fichier projeté en mémoire.
+
+    Chaque enregistrement est délimité par une recherche de b"\\n" dans le
+    buffer ; la direction est lue comme un octet et la magnitude est
+    convertie directement depuis les octets de la ligne.
+
+    :param path: chemin du fichier de rotations
+    :return: générateur de mouvements signés
+    """
+    if os.path.getsize(path) == 0:
+        return
+
+    with open(path, 'rb') as f, \
+         mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+        size = len(buffer)
+        pos = 0
+
+        while pos < size:
+            end = buffer.find(b"\n", pos)
+            if end == -1:
+                end = size
+
+            # Les lignes vides (ou réduites à "\r") sont ignorées
+            if end > pos and buffer[pos] in BYTE_SIGNS:
+                yield int(buffer[pos + 1:end]) * BYTE_SIGNS[buffer[pos]]
+
+            pos = end + 1
+
+# ===========================================================================
+
+# %% ========================================================================
+# Résolution
+def solve(path: str) -> tuple:
+    """
+    Calcule les passwords des parties 1 et 2 en une seule passe.
+
+    La partie 1 compte les arrêts exacts sur 0, la partie 2 les passages
+    sur 0, avec la même correction que `part2.solve` pour les mouvements
+    négatifs.
+
+    :param path: chemin du fichier de rotations
+    :return: (password partie 1, password partie 2)
+    :rtype: tuple
+    """
+    zero_stops: int     = 0      # arrêts exacts sur 0 (partie 1)
+    zero_passes: int    = 0      # passages sur 0 (partie 2)
+    current_pos: int    = START  # position initiale
+
+    for movements in iter_movements(path):
+        # Position non modulo après le mouvement
+        next_pos = current_pos + movements
+
+        # Nombre de passages "modulo" entre current_pos et next_pos
+        div = next_pos // MOD - current_pos // MOD
+
+        zero_passes += abs(div) \
+                       - int(current_pos == 0 and div < 0) \
+                       + int(next_pos % MOD == 0 and movements < 0)
+
+        # Nouvelle position modulo
+        current_pos = next_pos % MOD
+        if current_pos == 0:
+            zero_stops += 1
+
+    return zero_stops, zero_passes
+
+# ===========================================================================
+
+# %%
+if __name__ == "__main__":
+    RESULT_1, RESULT_2 = solve("./Day1/input.txt")
+
+    print("\n" + "═" * 60)
+    print("   🔐 Advent of Code 2025 — Day 1 | Flux".center(60))
+    print("═" * 60)
+    print(f"Password (partie 1) : \033[96m{RESULT_1}\033[0m")
+    print(f"Password (partie 2) : \033[96m{RESULT_2}\033[0m")
+    print("═" * 60 + "\n")
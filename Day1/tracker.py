@@ -0,0 +1,150 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Advent Of Code 2025
+===================
+Day : 1
+Part : 1 & 2 (suivi incrémental)
+
+Ce script fournit un suivi "en ligne" du cadran : les rotations sont
+ajoutées au fil de l'eau (une par une ou par lots) et les passwords des
+parties 1 et 2 sont disponibles à tout moment en O(1).
+
+L'état complet tient en quelques entiers (position courante et compteurs) :
+il peut être sauvegardé dans un petit fichier puis rechargé, ce qui évite
+de rejouer tout l'historique à chaque nouvel arrivage de rotations.
+
+.. codeauthor:: Alexandre Condette <alexandre.condette@wanadoo.fr>
+"""
+
+# %% ========================================================================
+# Imports
+import json
+# ===========================================================================
+
+# %% ========================================================================
+# Constantes
+MOD: int = 100                     # Taille du module (0..99)
+SIGNS: dict = {"R": 1, "L": -1}    # Mapping direction → signe
+START: int = 50                    # Position initiale
+
+# ===========================================================================
+
+# %% ========================================================================
+# Input data
+def get_input(day: int = 1, example: bool = False) -> list:
+    """
+    Lit le fichier d'input pour le jour donné.
+
+    :param day: numéro du jour AOC
+    :param example: si True, utilise le fichier example.txt sinon input.txt
+    :return: liste de lignes du fichier
+    :rtype: list
+    """
+    file = 'example.txt' if example else 'input.txt'
+    with open(f"./Day{day}/{file}", 'r', encoding='utf-8') as f:
+        return f.readlines()
+
+# ===========================================================================
+
+# %% ========================================================================
+# Suivi du cadran
+class DialTracker:
+    """
+    Suivi incrémental du cadran circulaire avec :
+    - ajout de rotations une par une ou par lots,
+    - passwords des parties 1 et 2 en O(1),
+    - sauvegarde / reprise de l'état dans un fichier.
+    """
+
+    def __init__(self, position: int = START):
+        self.position = position % MOD   # position courante (0..MOD-1)
+        self.zero_stops = 0              # arrêts exacts sur 0 (partie 1)
+        self.zero_passes = 0             # passages sur 0 (partie 2)
+        self.steps = 0                   # nombre de rotations appliquées
+
+    @property
+    def part1(self) -> int:
+        """Password de la partie 1 pour les rotations reçues."""
+        return self.zero_stops
+
+    @property
+    def part2(self) -> int:
+        """Password de la partie 2 pour les rotations reçues."""
+        return self.zero_passes
+
+    def move(self, movements: int) -> None:
+        """
+        Applique un mouvement signé, avec la même logique que `part2.solve`.
+        """
+        # Position non modulo après le mouvement
+        next_pos = self.position + movements
+
+        # Nombre de passages "modulo" entre la position courante et next_pos
+        div = next_pos // MOD - self.position // MOD
+
+        # Mise à jour des compteurs avec correction des passages sur 0
+        self.zero_passes += abs(div) \
+                            - int(self.position == 0 and div < 0) \
+                            + int(next_pos % MOD == 0 and movements < 0)
+
+        self.position = next_pos % MOD
+        if self.position == 0:
+            self.zero_stops += 1
+
+        self.steps += 1
+
+    def rotate(self, rotation: str) -> None:
+        """Applique une rotation sous forme de chaîne, ex. "R10" ou "L5"."""
+        rotation = rotation.strip()
+        self.move(int(rotation[1:]) * SIGNS[rotation[0]])
+
+    def extend(self, rotations) -> None:
+        """Applique un lot de rotations (les lignes vides sont ignorées)."""
+        for rotation in rotations:
+            if rotation.strip():
+                self.rotate(rotation)
+
+    def save(self, path: str) -> None:
+        """Sauvegarde l'état du suivi dans un fichier JSON."""
+        state = {
+            "mod": MOD,
+            "position": self.position,
+            "zero_stops": self.zero_stops,
+            "zero_passes": self.zero_passes,
+            "steps": self.steps,
+        }
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(state, f)
+
+    @classmethod
+    def load(cls, path: str) -> "DialTracker":
+        """Recharge un suivi sauvegardé par `save`."""
+        with open(path, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+
+        if state["mod"] != MOD:
+            raise ValueError(f"Module incompatible : {state['mod']} (attendu {MOD})")
+
+        tracker = cls(state["position"])
+        tracker.zero_stops = state["zero_stops"]
+        tracker.zero_passes = state["zero_passes"]
+        tracker.steps = state["steps"]
+
+        return tracker
+
+# ===========================================================================
+
+# %%
+if __name__ == "__main__":
+    TRACKER = DialTracker()
+    TRACKER.extend(get_input(1, False))
+
+    print("\n" + "═" * 60)
+    print("   🔐 Advent of Code 2025 — Day 1 | Suivi".center(60))
+    print("═" * 60)
+    print(f"Rotations appliquées : \033[96m{TRACKER.steps}\033[0m")
+    print(f"Password (partie 1) : \033[96m{TRACKER.part1}\033[0m")
+    print(f"Password (partie 2) : \033[96m{TRACKER.part2}\033[0m")
+    print("═" * 60 + "\n")
@@ -0,0 +1,237 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Advent Of Code 2025
+===================
+Day : 1
+Part : 1 & 2 (moteur NumPy)
+
+Ce script calcule les "passwords" des parties 1 et 2 du jour 1 sans
+boucle Python par ligne :
+    - le fichier est lu en octets et découpé en blocs de lignes complètes,
+    - chaque bloc est décodé en tableau int64 de mouvements signés
+      (préfixes R/L et magnitudes), avec une seule valeur par ligne,
+    - les positions non modulo sont obtenues par une somme cumulée, la
+      position finale d'un bloc servant de départ au suivant,
+    - les passages sur 0 sont comptés par opérations vectorisées.
+
+La mémoire de travail est bornée par la taille d'un bloc (`CHUNK_BYTES`).
+
+Les résultats sont identiques à ceux de `part1.solve` et `part2.solve`.
+
+.. codeauthor:: Alexandre Condette <alexandre.condette@wanadoo.fr>
+"""
+
+# %% ========================================================================
+# Imports
+import numpy as np
+# ===========================================================================
+
+# %% ========================================================================
+# Constantes
+MOD: int = 100                     # Taille du module (0..99)
+SIGNS: dict = {"R": 1, "L": -1}    # Mapping direction → signe
+START: int = 50                    # Position initiale
+
+# Puissances de 10 représentables en int64 (magnitudes jusqu'à 18 chiffres)
+POW10 = 10 ** np.arange(19, dtype=np.int64)
+
+CHUNK_BYTES: int = 1 << 24         # Taille visée d'un bloc de lignes
+
+# ===========================================================================
+
+# %% ========================================================================
+# Input data
+def get_input(day: int = 1, example: bool = False) -> bytes:
+    """
+    Lit le fichier d'input pour le jour donné, en octets bruts.
+
+    :param day: numéro du jour AOC
+    :param example: si True, utilise le fichier example.txt sinon input.txt
+    :return: contenu brut du fichier
+    :rtype: bytes
+    """
+    file = 'example.txt' if example else 'input.txt'
+    with open(f"./Day{day}/{file}", 'rb') as f:
+        return f.read()
+
+# ===========================================================================
+
+# %% ========================================================================
+# Décodage
+def decode_rotations(data) -> np.ndarray:
+    """
+    Décode les rotations en un tableau int64 de mouvements signés.
+
+    Le décodage est vectorisé sur les lignes, avec une valeur par ligne :
+        - repérage des fins de ligne,
+        - lecture du préfixe (R/L) au début de chaque ligne,
+        - magnitude lue de droite à gauche, une colonne d'octets à la fois
+          à partir de la fin de chaque ligne ; seules les lignes non encore
+          épuisées restent actives, ce qui borne le travail total par la
+          taille du buffer.
+
+    Les lignes vides (ou sans préfixe R/L) sont ignorées ; les autres
+    caractères (\r, espaces...) ne comptent pas comme chiffres.
+
+    :param data: contenu brut (bytes) ou liste de lignes, ex. ["R10", "L5"]
+    :return: mouvements signés, ex. [10, -5]
+    :rtype: np.ndarray
+    """
+    if not isinstance(data, (bytes, bytearray, memoryview)):
+        data = "\n".join(line.strip() for line in data).encode()
+
+    # Garantit une fin de ligne finale pour que chaque ligne ait sa borne
+    if data and data[-1:] != b"\n":
+        data = bytes(data) + b"\n"
+
+    buffer = np.frombuffer(data, dtype=np.uint8)
+    if buffer.size == 0:
+        return np.zeros(0, dtype=np.int64)
+
+    # Bornes des lignes : [starts[i], ends[i]] où ends[i] pointe sur le \n
+    ends = np.flatnonzero(buffer == ord("\n"))
+    starts = np.concatenate(([0], ends[:-1] + 1))
+
+    # Préfixes de direction (une ligne vide commence sur son propre \n)
+    first = buffer[starts]
+    valid = (first == ord("R")) | (first == ord("L"))
+    starts, cursor, first = starts[valid], ends[valid] - 1, first[valid]
+    del ends, valid
+
+    magnitudes = np.zeros(starts.size, dtype=np.int64)
+    rank = np.zeros(starts.size, dtype=np.uint8)
+
+    # Colonnes d'octets de droite à gauche, sur les lignes encore actives
+    active = np.arange(starts.size)
+    while active.size:
+        active = active[cursor[active] > starts[active]]
+        byte = buffer[cursor[active]]
+        is_digit = (byte >= ord("0")) & (byte <= ord("9"))
+
+        hit = active[is_digit]
+        magnitudes[hit] += (byte[is_digit].astype(np.int64) - ord("0")) * POW10[rank[hit]]
+        rank[hit] = np.minimum(rank[hit] + 1, POW10.size - 1)
+        cursor[active] -= 1
+
+    return np.where(first == ord("R"), magnitudes * SIGNS["R"], magnitudes * SIGNS["L"])
+
+# ---------------------------------------------------------------------------
+def iter_chunks(data, chunk_bytes: int = CHUNK_BYTES):
+    """
+    Découpe le contenu brut en blocs d'environ `chunk_bytes` octets, chacun
+    terminé par une fin de ligne (ou par la fin du contenu).
+
+    :param data: contenu brut (bytes) ou liste de lignes
+    :param chunk_bytes: taille visée d'un bloc
+    :return: générateur de vues (memoryview) sur les blocs
+    """
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    elif not isinstance(data, (bytes, bytearray)):
+        data = "\n".join(line.strip() for line in data).encode()
+
+    view = memoryview(data)
+    lo = 0
+
+    while lo < len(data):
+        hi = lo + chunk_bytes
+        if hi < len(data):
+            # Coupe après la dernière fin de ligne du bloc (ou la suivante)
+            cut = data.rfind(b"\n", lo, hi)
+            if cut == -1:
+                cut = data.find(b"\n", hi)
+            hi = len(data) if cut == -1 else cut + 1
+        else:
+            hi = len(data)
+
+        yield view[lo:hi]
+        lo = hi
+
+# ---------------------------------------------------------------------------
+def positions(movements: np.ndarray, start: int = START) -> np.ndarray:
+    """
+    Calcule les positions non modulo, position initiale incluse.
+
+    :param movements: mouvements signés
+    :param start: position de départ
+    :return: positions [start, start + m0, start + m0 + m1, ...]
+    :rtype: np.ndarray
+    """
+    return np.concatenate(([start], start + np.cumsum(movements, dtype=np.int64)))
+
+# ===========================================================================
+
+# %% ========================================================================
+# Résolution
+def solve_part1(data, chunk_bytes: int = CHUNK_BYTES) -> int:
+    """
+    Calcule le password de la partie 1 : nombre d'arrêts exacts sur 0.
+
+    :param data: contenu brut (bytes) ou liste de lignes
+    :param chunk_bytes: taille visée d'un bloc de lignes
+    :return: valeur finale du password
+    :rtype: int
+    """
+    password = 0
+    start = START
+
+    for chunk in iter_chunks(data, chunk_bytes):
+        pos = positions(decode_rotations(chunk), start)
+        password += int(np.count_nonzero(pos[1:] % MOD == 0))
+
+        # Seule la position modulo est transmise au bloc suivant
+        start = int(pos[-1] % MOD)
+
+    return password
+
+# ---------------------------------------------------------------------------
+def solve_part2(data, chunk_bytes: int = CHUNK_BYTES) -> int:
+    """
+    Calcule le password de la partie 2 : nombre de passages sur 0.
+
+    Pour chaque mouvement, avec p (avant) et q (après) en positions non modulo :
+        div = q // MOD - p // MOD
+        password += |div| - [p % MOD == 0 et div < 0] + [q % MOD == 0 et mouvement < 0]
+
+    Ces termes ne changent pas si p et q sont décalés d'un multiple de MOD :
+    chaque bloc repart de la position modulo atteinte par le précédent.
+
+    :param data: contenu brut (bytes) ou liste de lignes
+    :param chunk_bytes: taille visée d'un bloc de lignes
+    :return: valeur finale du password
+    :rtype: int
+    """
+    password = 0
+    start = START
+
+    for chunk in iter_chunks(data, chunk_bytes):
+        movements = decode_rotations(chunk)
+        pos = positions(movements, start)
+        before, after = pos[:-1], pos[1:]
+
+        div = after // MOD - before // MOD
+
+        password += int(np.abs(div).sum()
+                        - np.count_nonzero((before % MOD == 0) & (div < 0))
+                        + np.count_nonzero((after % MOD == 0) & (movements < 0)))
+
+        start = int(pos[-1] % MOD)
+
+    return password
+
+# ===========================================================================
+
+# %%
+if __name__ == "__main__":
+    DATA = get_input(1, False)
+    RESULT_1 = solve_part1(DATA)
+    RESULT_2 = solve_part2(DATA)
+
+    print("\n" + "═" * 60)
+    print("   🔐 Advent of Code 2025 — Day 1 | NumPy".center(60))
+    print("═" * 60)
+    print(f"Password (partie 1) : \033[96m{RESULT_1}\033[0m")
+    print(f"Password (partie 2) : \033[96m{RESULT_2}\033[0m")
+    print("═" * 60 + "\n")
@@ -0,0 +1,159 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Advent Of Code 2025
+===================
+Day : 2
+Part : 1 & 2 (index pré-calculé)
+
+Ce script construit un index trié de tous les identifiants "invalides"
+jusqu'à un nombre de chiffres donné, pour répondre à de nombreux lots
+d'intervalles sans parcourir les identifiants :
+    - règle de la partie 1 : motif répété exactement deux fois (s * (10^k + 1)),
+    - règle de la partie 2 : motif répété au moins `n` fois.
+
+L'index stocke les valeurs triées et leurs sommes préfixes : la somme et
+le nombre d'identifiants invalides dans [a, b] s'obtiennent par deux
+recherches dichotomiques. L'index peut être sauvegardé puis rechargé.
+
+.. codeauthor:: Alexandre Condette <alexandre.condette@wanadoo.fr>
+"""
+
+# %% ========================================================================
+# Imports
+import json
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
+# ===========================================================================
+
+# %% ========================================================================
+# Constantes
+MAX_DIGITS: int = 12    # Nombre de chiffres maximal couvert par défaut
+# ===========================================================================
+
+# %% ========================================================================
+# Input data
+def get_input(day: int = 1, example: bool = False) -> str:
+    """
+    Lit le fichier d'input pour le jour donné.
+
+    :param day: numéro du jour AOC
+    :param example: si True, utilise le fichier example.txt sinon input.txt
+    :return: contenu du fichier
+    :rtype: str
+    """
+    file = 'example.txt' if example else 'input.txt'
+    with open(f"./Day{day}/{file}", 'r', encoding='utf-8') as f:
+        return f.read()
+
+# ===========================================================================
+
+# %% ========================================================================
+# Index
+class RepeatedPatternIndex:
+    """
+    Index trié des identifiants à motif répété avec :
+    - sommes préfixes pour les requêtes par intervalle,
+    - requêtes unitaires ou par lot (chaîne "A-B,C-D,..."),
+    - sauvegarde / rechargement binaire.
+    """
+
+    def __init__(self, values, max_digits: int, n: int = 2, doubled: bool = False):
+        self.values = array('q', values)
+        self.prefix = list(accumulate(self.values, initial=0))
+        self.max_digits = max_digits
+        self.n = n
+        self.doubled = doubled
+
+    @classmethod
+    def build(cls, max_digits: int = MAX_DIGITS, n: int = 2,
+              doubled: bool = False) -> "RepeatedPatternIndex":
+        """
+        Énumère, dans l'ordre croissant, les identifiants invalides ayant
+        au plus `max_digits` chiffres.
+
+        :param max_digits: nombre de chiffres maximal (18 au plus)
+        :param n: nombre minimal de répétitions (règle de la partie 2)
+        :param doubled: si True, règle de la partie 1 (exactement deux fois)
+        """
+        if max_digits > 18:
+            raise ValueError("L'index est limité aux identifiants de 18 chiffres")
+
+        values = []
+        for L in range(1, max_digits + 1):
+            # Périodes d possibles pour un nombre à L chiffres
+            if doubled:
+                periods = [L // 2] if L % 2 == 0 else []
+            else:
+                periods = [d for d in range(1, L + 1) if L % d == 0 and L // d >= n]
+
+            # s * R(d) avec s à d chiffres ; un set évite les doublons
+            # (un nombre peut admettre plusieurs périodes)
+            found = set()
+            for d in periods:
+                R = (10 ** L - 1) // (10 ** d - 1)
+                found.update(s * R for s in range(10 ** (d - 1), 10 ** d))
+
+            values.extend(sorted(found))
+
+        return cls(values, max_digits, n, doubled)
+
+    def query(self, start: int, stop: int) -> tuple:
+        """Retourne (somme, nombre) des identifiants invalides de [start, stop]."""
+        if stop >= 10 ** self.max_digits:
+            raise ValueError(f"Borne {stop} hors de l'index ({self.max_digits} chiffres)")
+
+        i = bisect_left(self.values, start)
+        j = bisect_right(self.values, stop)
+
+        return self.prefix[j] - self.prefix[i], j - i
+
+    def query_ranges(self, data: str) -> tuple:
+        """Retourne (somme, nombre) pour une chaîne d'intervalles "A-B,C-D,..."."""
+        total, count = 0, 0
+        for ids in data.split(","):
+            start, stop = ids.split("-")
+            s, c = self.query(int(start), int(stop))
+            total += s
+            count += c
+
+        return total, count
+
+    def save(self, path: str) -> None:
+        """Sauvegarde l'index : un en-tête JSON puis les valeurs en binaire."""
+        header = {
+            "max_digits": self.max_digits,
+            "n": self.n,
+            "doubled": self.doubled,
+            "size": len(self.values),
+        }
+        with open(path, 'wb') as f:
+            f.write(json.dumps(header).encode() + b"\n")
+            self.values.tofile(f)
+
+    @classmethod
+    def load(cls, path: str) -> "RepeatedPatternIndex":
+        """Recharge un index sauvegardé par `save`."""
+        with open(path, 'rb') as f:
+            header = json.loads(f.readline())
+            values = array('q')
+            values.fromfile(f, header["size"])
+
+        return cls(values, header["max_digits"], header["n"], header["doubled"])
+
+# ===========================================================================
+
+# %%
+if __name__ == "__main__":
+    DATA = get_input(2, False)
+    RESULT_1 = RepeatedPatternIndex.build(doubled=True).query_ranges(DATA)[0]
+    RESULT_2 = RepeatedPatternIndex.build(n=2).query_ranges(DATA)[0]
+
+    print("\n" + "═" * 60)
+    print("   🔐 Advent of Code 2025 — Day 2 | Index".center(60))
+    print("═" * 60)
+    print(f"ID Invalides (partie 1) : \033[96m{RESULT_1}\033[0m")
+    print(f"ID Invalides (partie 2) : \033[96m{RESULT_2}\033[0m")
+    print("═" * 60 + "\n")
@@ -0,0 +1,226 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Advent Of Code 2025
+===================
+Day : 2
+Part : 2 (noyau NumPy)
+
+Ce script évalue des règles sur les chiffres d'identifiants par blocs
+entiers plutôt qu'entier par entier :
+    - un intervalle est découpé par nombre de chiffres, puis en blocs
+      alignés de BLOCK_SIZE valeurs,
+    - les chiffres sont obtenus par division / modulo vectorisés par les
+      puissances de 10, une seule fois pour la table des chiffres de poids
+      faible ; dans un bloc, les chiffres de poids fort sont constants,
+    - un prédicat (motif répété, ou règle fournie par l'utilisateur)
+      s'applique à toute la matrice et renvoie un masque booléen.
+
+La règle par défaut reproduit exactement `part2.is_repeated_pattern`.
+
+.. codeauthor:: Alexandre Condette <alexandre.condette@wanadoo.fr>
+"""
+
+# %% ========================================================================
+# Imports
+import numpy as np
+# ===========================================================================
+
+# %% ========================================================================
+# Constantes
+N: int = 2                                    # Répétitions minimales par défaut
+LOW_DIGITS: int = 6                           # Chiffres de poids faible tabulés
+BLOCK_SIZE: int = 10 ** LOW_DIGITS            # Valeurs par bloc (alignés)
+
+# Tables paresseuses : chiffres et valeurs de 0..BLOCK_SIZE-1
+_LOW_TABLE: dict = {}
+# ===========================================================================
+
+# %% ========================================================================
+# Input data
+def get_input(day: int = 1, example: bool = False) -> str:
+    """
+    Lit le fichier d'input pour le jour donné.
+
+    :param day: numéro du jour AOC
+    :param example: si True, utilise le fichier example.txt sinon input.txt
+    :return: contenu du fichier
+    :rtype: str
+    """
+    file = 'example.txt' if example else 'input.txt'
+    with open(f"./Day{day}/{file}", 'r', encoding='utf-8') as f:
+        return f.read()
+
+# ===========================================================================
+
+# %% ========================================================================
+# Extraction des chiffres
+def digits_matrix(values: np.ndarray, L: int) -> np.ndarray:
+    """
+    Extrait les chiffres de valeurs quelconques ayant toutes L chiffres.
+
+    La matrice est organisée chiffre par chiffre (une ligne par position,
+    poids fort en premier) : chaque ligne est contiguë en mémoire, ce qui
+    rend les comparaisons entre positions rapides.
+
+    :param values: valeurs int64 à L chiffres
+    :param L: nombre de chiffres
+    :return: matrice (L, len(values)) des chiffres
+    :rtype: np.ndarray
+    """
+    digits = np.empty((L, values.size), dtype=np.uint8)
+    rest = values.astype(np.int64)
+
+    for j in range(L - 1, -1, -1):
+        rest, digits[j] = np.divmod(rest, 10)
+
+    return digits
+
+# ---------------------------------------------------------------------------
+def low_table() -> tuple:
+    """
+    Table des chiffres de 0..BLOCK_SIZE-1 (sur LOW_DIGITS chiffres) et des
+    valeurs correspondantes, calculée une seule fois.
+
+    :return: (matrice (LOW_DIGITS, BLOCK_SIZE) des chiffres, valeurs int64)
+    :rtype: tuple
+    """
+    if not _LOW_TABLE:
+        offsets = np.arange(BLOCK_SIZE, dtype=np.int64)
+        _LOW_TABLE["digits"] = digits_matrix(offsets, LOW_DIGITS)
+        _LOW_TABLE["offsets"] = offsets
+
+    return _LOW_TABLE["digits"], _LOW_TABLE["offsets"]
+
+# ---------------------------------------------------------------------------
+def block_digits(head: int, i0: int, i1: int, L: int) -> np.ndarray:
+    """
+    Chiffres des valeurs head * BLOCK_SIZE + i, pour i dans [i0, i1).
+
+    Dans un bloc aligné, les LOW_DIGITS chiffres de poids faible sont ceux
+    de la table pré-calculée et les chiffres de poids fort sont constants :
+    aucune division n'est nécessaire.
+
+    :param head: préfixe commun du bloc (valeur // BLOCK_SIZE)
+    :param i0: premier décalage (inclus)
+    :param i1: dernier décalage (exclu)
+    :param L: nombre de chiffres des valeurs
+    :return: matrice (L, i1 - i0) des chiffres
+    :rtype: np.ndarray
+    """
+    table, _ = low_table()
+    low = table[max(LOW_DIGITS - L, 0):, i0:i1]
+
+    if L <= LOW_DIGITS:
+        return low
+
+    high = np.array([int(c) for c in str(head)], dtype=np.uint8)
+    return np.concatenate((np.broadcast_to(high[:, None], (high.size, i1 - i0)), low))
+
+# ===========================================================================
+
+# %% ========================================================================
+# Prédicats vectorisés
+def repeated_pattern_mask(digits: np.ndarray, n: int = N) -> np.ndarray:
+    """
+    Version vectorisée de `part2.is_repeated_pattern`.
+
+    Un nombre admet la période k (k divise L) si chacun de ses chiffres
+    est égal à celui situé k positions plus tôt.
+
+    :param digits: matrice (L, nombre de valeurs) des chiffres
+    :param n: nombre minimal de répétitions requises
+    :return: masque des valeurs composées d'un motif répété
+    :rtype: np.ndarray
+    """
+    L = digits.shape[0]
+    mask = np.zeros(digits.shape[1], dtype=bool)
+
+    for k in range(1, L // n + 1):
+        if L % k != 0:
+            continue
+
+        # k == L : motif = nombre entier (toujours vrai, possible si n <= 1)
+        period = np.ones(digits.shape[1], dtype=bool)
+        for j in range(k, L):
+            period &= digits[j] == digits[j - k]
+        mask |= period
+
+    return mask
+
+# ===========================================================================
+
+# %% ========================================================================
+# Résolution
+def scan_range(start: int, stop: int, predicate=None, n: int = N) -> tuple:
+    """
+    Somme et nombre des entiers de [start, stop] vérifiant un prédicat.
+
+    L'intervalle est découpé par nombre de chiffres puis en blocs alignés
+    sur BLOCK_SIZE ; le prédicat est appliqué bloc par bloc.
+
+    :param start: borne basse (incluse)
+    :param stop: borne haute (incluse)
+    :param predicate: fonction matrice (L, m) des chiffres → masque booléen
+                      de taille m ; par défaut, règle du motif répété au
+                      moins `n` fois
+    :param n: nombre minimal de répétitions (prédicat par défaut)
+    :return: (somme, nombre)
+    :rtype: tuple
+    """
+    if predicate is None:
+        predicate = lambda digits: repeated_pattern_mask(digits, n)
+
+    _, offsets = low_table()
+    total, count = 0, 0
+
+    for L in range(len(str(start)), len(str(stop)) + 1):
+        # Restriction de l'intervalle aux nombres à L chiffres
+        lo = max(start, 10 ** (L - 1))
+        hi = min(stop, 10 ** L - 1)
+
+        for head in range(lo // BLOCK_SIZE, hi // BLOCK_SIZE + 1):
+            base = head * BLOCK_SIZE
+            i0 = max(lo - base, 0)
+            i1 = min(hi - base + 1, BLOCK_SIZE)
+
+            mask = predicate(block_digits(head, i0, i1, L))
+
+            # Les décalages restent petits : leur somme ne déborde pas en int64
+            matched = int(np.count_nonzero(mask))
+            total += matched * base + int(offsets[i0:i1][mask].sum())
+            count += matched
+
+    return total, count
+
+# ---------------------------------------------------------------------------
+def solve(data: str, n: int = N, predicate=None) -> int:
+    """
+    Additionne les identifiants invalides de chaque intervalle "start-stop".
+
+    :param data: chaîne contenant les intervalles séparés par des virgules
+    :param n: nombre minimal de répétitions exigées pour être invalide
+    :param predicate: règle optionnelle sur la matrice des chiffres
+    :return: somme de tous les identifiants invalides
+    :rtype: int
+    """
+    invalid_id: int = 0
+
+    for ids in data.split(","):
+        start, stop = ids.split("-")
+        invalid_id += scan_range(int(start), int(stop), predicate, n)[0]
+
+    return invalid_id
+
+# ===========================================================================
+
+# %%
+if __name__ == "__main__":
+    RESULT = solve(get_input(2, False), N)
+
+    print("\n" + "═" * 60)
+    print("   🔐 Advent of Code 2025 — Day 2 | NumPy".center(60))
+    print("═" * 60)
+    print(f"ID Invalides trouvés : \033[96m{RESULT}\033[0m")
+    print("═" * 60 + "\n")
@@ -17,6 +17,11 @@ la même séquence de chiffres (ex : 12  → 1212,  345 → 345345).
 # %% ========================================================================
 # Imports
 from math import ceil, floor
+
+try:
+    from Day2.part2 import merge_ranges
+except ImportError:     # Exécution directe : python Day2/part1.py
+    from part2 import merge_ranges
 # ===========================================================================
 
 # %% ========================================================================
@@ -38,7 +43,7 @@ def get_input(day: int = 1, example: bool = False) -> list:
 
 # %% ========================================================================
 # Résolution
-def solve(data: list) -> int:
+def solve(data: list, merge: bool = False) -> int:
     """
     Calcule la somme de tous les identifiants invalides dans les plages spécifiées.
 
@@ -53,11 +58,38 @@ def solve(data: list) -> int:
         - Plutôt que de tester chaque nombre : on détecte mathématiquement
           toutes les valeurs ayant le pattern s * m où m = 10^k + 1.
 
+    Option `merge` :
+        - Les plages sont d'abord fusionnées et découpées par nombre de
+          chiffres (`merge_ranges`) : chaque bande de L chiffres n'est
+          traitée qu'une fois, avec le seul k = L / 2 possible.
+        - Les identifiants présents dans plusieurs plages ne sont alors
+          comptés qu'une seule fois.
+
     :param data: Chaîne contenant plusieurs plages, séparées par des virgules.
+    :param merge: si True, fusionne les plages avant le calcul
     :return: Somme de tous les identifiants invalides présents dans les plages.
     :rtype: int
     """
     invalid_id: int = 0
+
+    if merge:
+        for start, stop in merge_ranges(data):
+            L = len(str(start))
+            if L % 2 != 0:
+                continue
+
+            k = L // 2
+            m = 10 ** k + 1
+
+            # Valeurs s à k chiffres telles que s*m tombe dans [start, stop]
+            s_lo = max(-(-start // m), 10 ** (k - 1))
+            s_hi = min(stop // m, 10 ** k - 1)
+
+            if s_lo <= s_hi:
+                invalid_id += m * (s_lo + s_hi) * (s_hi - s_lo + 1) // 2
+
+        return invalid_id
+
     all_ids = data.split(",")
     
     for ids in all_ids:
@@ -16,8 +16,10 @@ Exemples :
     - 1111111   → motif "1" répété sept fois
     - 565656    → motif "56" répété trois fois
 
-Cette version utilise une méthode directe et fiable pour vérifier
-les motifs répétés.
+Plutôt que de tester chaque entier, les nombres à motif répété sont
+dénombrés par formule fermée pour chaque longueur de nombre, avec une
+inclusion–exclusion (Möbius) sur les périodes possibles. Le coût par
+intervalle ne dépend plus de sa largeur.
 
 .. codeauthor:: Alexandre Condette <alexandre.condette@wanadoo.fr>
 """
@@ -78,30 +80,174 @@ def is_repeated_pattern(x: int, n: int = 2) -> bool:
     return False
 
 # ---------------------------------------------------------------------------
-def solve(data: list, n: int = 2) -> int:
+def mobius(k: int) -> int:
+    """
+    Fonction de Möbius μ(k) : 0 si k a un facteur carré,
+    sinon (-1)^(nombre de facteurs premiers).
+
+    :param k: entier strictement positif
+    :return: μ(k)
+    :rtype: int
+    """
+    result = 1
+    p = 2
+    while p * p <= k:
+        if k % p == 0:
+            k //= p
+            if k % p == 0:
+                return 0
+            result = -result
+        p += 1
+
+    return -result if k > 1 else result
+
+# ---------------------------------------------------------------------------
+def divisors(k: int) -> list:
+    """
+    Liste triée des diviseurs de k.
+
+    :param k: entier strictement positif
+    :return: diviseurs de k
+    :rtype: list
+    """
+    return [d for d in range(1, k + 1) if k % d == 0]
+
+# ---------------------------------------------------------------------------
+def periodic_range(start: int, stop: int, L: int, q: int) -> tuple:
+    """
+    Somme et nombre des entiers à L chiffres de [start, stop] admettant
+    la période q (q divise L), c'est-à-dire de la forme s * R avec :
+        - R = (10^L - 1) / (10^q - 1)  (ex : L=6, q=2 → 10101),
+        - s un nombre à q chiffres.
+
+    :param start: borne basse (incluse)
+    :param stop: borne haute (incluse)
+    :param L: nombre de chiffres
+    :param q: longueur de la période
+    :return: (somme, nombre)
+    :rtype: tuple
+    """
+    R = (10 ** L - 1) // (10 ** q - 1)
+
+    # On cherche les valeurs s telles que s*R tombe dans [start, stop]
+    s_lo = max(-(-start // R), 10 ** (q - 1))
+    s_hi = min(stop // R, 10 ** q - 1)
+
+    if s_lo > s_hi:
+        return 0, 0
+
+    count = s_hi - s_lo + 1
+    return R * (s_lo + s_hi) * count // 2, count
+
+# ---------------------------------------------------------------------------
+def repeated_pattern_range(start: int, stop: int, n: int = 2) -> tuple:
+    """
+    Somme et nombre des entiers de [start, stop] composés d'un motif
+    répété au moins `n` fois, sans parcourir l'intervalle.
+
+    Pour chaque longueur L, un nombre est invalide si sa plus petite
+    période p divise L avec L / p >= n. Les nombres de période q (q | L)
+    incluant aussi ceux de période plus petite, la somme des nombres de
+    plus petite période exactement p s'obtient par inversion de Möbius :
+        f(p) = Σ_{q | p} μ(p / q) · g(q)
+    où g(q) est donné par `periodic_range`. Le coût est en O(digits²).
+
+    :param start: borne basse (incluse)
+    :param stop: borne haute (incluse)
+    :param n: nombre minimal de répétitions requises
+    :return: (somme, nombre) des identifiants invalides
+    :rtype: tuple
+    """
+    total, count = 0, 0
+
+    for L in range(len(str(start)), len(str(stop)) + 1):
+        # Restriction de l'intervalle aux nombres à L chiffres
+        lo = max(start, 10 ** (L - 1))
+        hi = min(stop, 10 ** L - 1)
+        if lo > hi:
+            continue
+
+        periods = divisors(L)
+        for p in periods:
+            if L // p < n:
+                continue
+
+            for q in periods:
+                mu = mobius(p // q) if p % q == 0 else 0
+                if mu:
+                    s, c = periodic_range(lo, hi, L, q)
+                    total += mu * s
+                    count += mu * c
+
+    return total, count
+
+# ---------------------------------------------------------------------------
+def merge_ranges(data: str) -> list:
+    """
+    Trie et fusionne les intervalles "A-B" (chevauchants ou contigus), puis
+    découpe les intervalles fusionnés aux changements de nombre de chiffres.
+
+    Chaque identifiant n'apparaît ainsi qu'une seule fois, dans une bande
+    de nombres ayant tous la même longueur (ex : 95-1012 → 95-99, 100-999,
+    1000-1012).
+
+    :param data: chaîne contenant les intervalles séparés par des virgules
+    :return: liste triée de bandes (start, stop) disjointes
+    :rtype: list
+    """
+    ranges = sorted(tuple(map(int, ids.split("-"))) for ids in data.split(","))
+
+    # Fusion des intervalles
+    merged = []
+    for start, stop in ranges:
+        if not merged or start > merged[-1][1] + 1:
+            merged.append([start, stop])
+        else:
+            merged[-1][1] = max(merged[-1][1], stop)
+
+    # Découpage par nombre de chiffres
+    bands = []
+    for start, stop in merged:
+        for L in range(len(str(start)), len(str(stop)) + 1):
+            bands.append((max(start, 10 ** (L - 1)), min(stop, 10 ** L - 1)))
+
+    return bands
+
+# ---------------------------------------------------------------------------
+def solve(data: list, n: int = 2, merge: bool = False) -> int:
     """
     Parcourt chaque intervalle "start-stop" listé dans l'input
     et additionne tous les identifiants invalides selon la règle
     des motifs répétés.
 
+    Avec `merge`, les intervalles sont d'abord fusionnés et découpés par
+    nombre de chiffres (`merge_ranges`) : chaque identifiant n'est compté
+    qu'une fois, même s'il apparaît dans plusieurs intervalles.
+
     :param data: chaîne contenant les intervalles séparés par des virgules
     :param n: nombre minimal de répétitions exigées pour être invalide
+    :param merge: si True, fusionne les intervalles avant le calcul
     :return: somme de tous les identifiants invalides
     :rtype: int
     """
     invalid_id: int = 0
+
+    if merge:
+        for start, stop in merge_ranges(data):
+            invalid_id += repeated_pattern_range(start, stop, n)[0]
+
+        return invalid_id
+
     all_ids = data.split(",")
 
     for ids in all_ids:
         start, stop = ids.split("-")
         start = int(start)
         stop = int(stop)
-        
-        # Vérification brute-force (fiable pour la taille de l'énigme)
-        for x in range(start, stop + 1):
-            if is_repeated_pattern(x, n):
-                invalid_id += x
-                    
+
+        # Dénombrement par formule fermée (indépendant de la largeur)
+        invalid_id += repeated_pattern_range(start, stop, n)[0]
+
     return invalid_id
 
 # ===========================================================================
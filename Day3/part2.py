@@ -19,7 +19,13 @@ exactement `n` digits parmi ceux présents dans l’identifiant d’origine.
 
 # %% ========================================================================
 # Imports
+from functools import lru_cache
+# ===========================================================================
 
+# %% ========================================================================
+# Constantes
+CHUNK: int = 1024   # Taille (en digits) des conversions directes bytes → int
+HOLE: bytes = b"_"  # Digit absent de la sous-séquence courante
 # ===========================================================================
 
 # %% ========================================================================
@@ -39,6 +45,48 @@ def get_input(day: int = 1, example: bool = False) -> list:
 
 # ===========================================================================
 
+# %% ========================================================================
+# Conversion digits → entier
+@lru_cache(maxsize=None)
+def pow10(k: int) -> int:
+    """
+    Puissance 10^k, mise en cache (les découpages réutilisent les mêmes k).
+
+    :param k: exposant
+    :return: 10^k
+    :rtype: int
+    """
+    return 10 ** k
+
+# ---------------------------------------------------------------------------
+def digits_to_int(buffer: bytes) -> int:
+    """
+    Convertit un buffer de digits ASCII en entier par « diviser pour régner ».
+
+    Le buffer est coupé en une partie haute et une partie basse dont la
+    taille est CHUNK × 2^j, puis valeur = haute × 10^taille + basse. Le coût
+    est dominé par des multiplications de grands entiers (sous-quadratique),
+    au lieu du `int(str)` quadratique, et aucune conversion ne dépasse la
+    limite de digits de CPython.
+
+    :param buffer: digits ASCII, ex. b"987654321"
+    :return: entier correspondant
+    :rtype: int
+    """
+    if len(buffer) <= CHUNK:
+        return int(buffer) if buffer else 0
+
+    size = CHUNK
+    while 2 * size < len(buffer):
+        size *= 2
+
+    high = digits_to_int(buffer[:-size])
+    low = digits_to_int(buffer[-size:])
+
+    return high * pow10(size) + low
+
+# ===========================================================================
+
 # %% ========================================================================
 # Résolution
 def max_subsequence_as_number(digits: list, n: int) -> int:
@@ -77,7 +125,73 @@ def max_subsequence_as_number(digits: list, n: int) -> int:
     final = stack[:n]
     
     # Construction du nombre final
-    return int("".join(str(d) for d in final))
+    return digits_to_int(bytes(ord("0") + d for d in final))
+
+# ---------------------------------------------------------------------------
+def deletion_order(digits: list) -> list:
+    """
+    Ordre dans lequel les digits disparaissent quand on réduit la longueur
+    de la sous-séquence maximale de len(digits) à 0.
+
+    La meilleure sous-séquence de longueur k - 1 s'obtient en retirant un
+    seul digit de celle de longueur k (le premier suivi d'un digit plus
+    grand, sinon le dernier). Ces retraits successifs sont exactement les
+    dépilements de la « monotonic stack » sans limite de suppressions,
+    suivis des digits restés dans la pile, du sommet vers la base : l'ordre
+    complet est obtenu en une passe, en O(L).
+
+    :param digits: liste de chiffres extraits de la ligne
+    :return: index des digits, dans l'ordre de leur suppression
+    :rtype: list
+    """
+    order = []
+    stack = []
+    for i, d in enumerate(digits):
+        while stack and digits[stack[-1]] < d:
+            order.append(stack.pop())
+        stack.append(i)
+
+    order.extend(reversed(stack))
+    return order
+
+# ---------------------------------------------------------------------------
+def max_subsequences(digits: list, lengths=None) -> list:
+    """
+    Détermine la plus grande sous-séquence pour plusieurs longueurs k,
+    à partir d'un seul ordre de suppression (`deletion_order`).
+
+    La sous-séquence de longueur k est formée des k derniers digits de
+    l'ordre de suppression, pris dans leur ordre d'origine. Les longueurs
+    sont traitées par ordre croissant en replaçant ces digits dans un
+    buffer à trous ; chaque valeur est ensuite extraite en O(L) (retrait
+    des trous, puis conversion en entier).
+
+    :param digits: liste de chiffres extraits de la ligne
+    :param lengths: longueurs k à calculer (par défaut : 1 à len(digits))
+    :return: valeurs maximales, dans l'ordre de `lengths`
+    :rtype: list
+    """
+    m = len(digits)
+    if lengths is None:
+        lengths = range(1, m + 1)
+
+    # Au-delà de la longueur de la ligne, on conserve tous les digits
+    lengths = [min(max(k, 0), m) for k in lengths]
+
+    order = deletion_order(digits)
+    buffer = bytearray(HOLE) * m
+    values = {}
+    kept = 0
+
+    for k in sorted(set(lengths)):
+        while kept < k:
+            kept += 1
+            i = order[m - kept]
+            buffer[i] = ord("0") + digits[i]
+
+        values[k] = digits_to_int(buffer.translate(None, HOLE))
+
+    return [values[k] for k in lengths]
 
 # ---------------------------------------------------------------------------
 def solve(data: list, n: int = 12) -> int:
@@ -104,6 +218,56 @@ def solve(data: list, n: int = 12) -> int:
         
     return joltage
 
+# ---------------------------------------------------------------------------
+def max_subsequence_buffer(line: bytes, n: int) -> bytearray:
+    """
+    Version compacte de `max_subsequence_as_number` pour les très longues
+    lignes : la pile est un `bytearray` de digits ASCII (un octet par digit)
+    et le résultat reste sous forme de buffer décimal.
+
+    L'ordre des octets ASCII étant celui des digits, on compare directement
+    les octets, sans conversion en int.
+
+    :param line: digits ASCII de la ligne, ex. b"818181911112111"
+    :param n: longueur de la sous-séquence maximale à conserver
+    :return: digits ASCII de la sous-séquence maximale
+    :rtype: bytearray
+    """
+    remove = len(line) - n
+    stack = bytearray()
+
+    for d in line:
+        while stack and remove > 0 and stack[-1] < d:
+            stack.pop()
+            remove -= 1
+
+        stack.append(d)
+
+    del stack[n:]
+    return stack
+
+# ---------------------------------------------------------------------------
+def solve_stream(path: str, n: int = 12) -> int:
+    """
+    Variante de `solve` pour des lignes de plusieurs millions de digits.
+
+    Les lignes sont lues une à une en octets, la sous-séquence est extraite
+    dans un buffer compact puis convertie par `digits_to_int`.
+
+    :param path: chemin du fichier d'entrée
+    :param n: longueur des sous-séquences à conserver
+    :return: somme des valeurs trouvées
+    :rtype: int
+    """
+    joltage = 0
+    with open(path, 'rb') as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                joltage += digits_to_int(max_subsequence_buffer(line, n))
+
+    return joltage
+
 # ===========================================================================
 
 # %%
@@ -0,0 +1,133 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Advent Of Code 2025
+===================
+Day : 3
+Part : 1 (moteur NumPy)
+
+Ce script calcule le joltage de la partie 1 pour toutes les lignes à la
+fois, sans liste Python par ligne :
+    - le fichier est lu en octets,
+    - les lignes de même longueur forment une matrice uint8 (un simple
+      reshape si toutes les lignes ont la même longueur),
+    - le premier digit est le maximum de chaque ligne hors dernière
+      colonne (argmax → première occurrence, comme `digits.index`),
+    - le second digit est le maximum à droite de cette position.
+
+.. codeauthor:: Alexandre Condette <alexandre.condette@wanadoo.fr>
+"""
+
+# %% ========================================================================
+# Imports
+import numpy as np
+# ===========================================================================
+
+# %% ========================================================================
+# Input data
+def get_input(day: int = 1, example: bool = False) -> bytes:
+    """
+    Lit le fichier d'input pour le jour donné, en octets bruts.
+
+    :param day: numéro du jour AOC
+    :param example: si True, utilise le fichier example.txt sinon input.txt
+    :return: contenu brut du fichier
+    :rtype: bytes
+    """
+    file = 'example.txt' if example else 'input.txt'
+    with open(f"./Day{day}/{file}", 'rb') as f:
+        return f.read()
+
+# ===========================================================================
+
+# %% ========================================================================
+# Découpage en matrices
+def digit_matrices(raw: bytes):
+    """
+    Découpe le contenu brut en matrices uint8 de digits, une par longueur
+    de ligne.
+
+    Cas rapide : si toutes les lignes ont la même longueur, le buffer est
+    simplement remis en forme (lignes × (largeur + fin de ligne)).
+    Sinon, les lignes sont regroupées par longueur.
+
+    :param raw: contenu brut du fichier
+    :return: générateur de matrices (nombre de lignes, longueur)
+    """
+    if raw and raw[-1:] != b"\n":
+        raw = bytes(raw) + b"\n"
+
+    buffer = np.frombuffer(raw, dtype=np.uint8)
+    ends = np.flatnonzero(buffer == ord("\n"))
+    if ends.size == 0:
+        return
+
+    starts = np.concatenate(([0], ends[:-1] + 1))
+    lengths = ends - starts
+    has_cr = (lengths > 0) & (buffer[np.maximum(ends - 1, 0)] == ord("\r"))
+
+    # Cas rapide : lignes de largeur constante et de même fin de ligne
+    # (une dernière ligne sans \r dans un fichier CRLF passe par le cas général)
+    stride = int(ends[0]) + 1
+    if buffer.size == stride * ends.size and (ends % stride == stride - 1).all() \
+            and (has_cr == has_cr[0]).all():
+        width = stride - 1 - int(has_cr[0])
+        if width > 0:
+            yield buffer.reshape(ends.size, stride)[:, :width] - ord("0")
+        return
+
+    # Cas général : regroupement des lignes par longueur utile
+    lengths = lengths - has_cr
+
+    for width in np.unique(lengths):
+        if width == 0:
+            continue
+        rows = starts[lengths == width]
+        yield buffer[rows[:, None] + np.arange(width)] - ord("0")
+
+# ===========================================================================
+
+# %% ========================================================================
+# Résolution
+def joltages(digits: np.ndarray) -> np.ndarray:
+    """
+    Calcule le joltage de chaque ligne d'une matrice de digits.
+
+    :param digits: matrice (lignes, longueur) de digits
+    :return: joltage de chaque ligne
+    :rtype: np.ndarray
+    """
+    # Premier digit : maximum hors dernière colonne (première occurrence)
+    index = digits[:, :-1].argmax(axis=1)
+    first_digit = digits[np.arange(digits.shape[0]), index]
+
+    # Second digit : maximum strictement à droite de l'index trouvé
+    columns = np.arange(digits.shape[1])
+    right = np.where(columns > index[:, None], digits, 0)
+    second_digit = right.max(axis=1)
+
+    return first_digit.astype(np.int64) * 10 + second_digit
+
+# ---------------------------------------------------------------------------
+def solve(raw: bytes) -> int:
+    """
+    Calcule le joltage total de toutes les lignes (règle de la Part 1).
+
+    :param raw: contenu brut du fichier
+    :return: joltage total
+    :rtype: int
+    """
+    return sum(int(joltages(digits).sum()) for digits in digit_matrices(raw))
+
+# ===========================================================================
+
+# %%
+if __name__ == "__main__":
+    RESULT = solve(get_input(3, False))
+
+    print("\n" + "═" * 60)
+    print("   🔐 Advent of Code 2025 — Day 3 | Part 1 (NumPy)".center(60))
+    print("═" * 60)
+    print(f"Joltage trouvé : \033[96m{RESULT}\033[0m")
+    print("═" * 60 + "\n")
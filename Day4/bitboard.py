@@ -0,0 +1,182 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Advent Of Code 2025
+===================
+Day : 4
+Part : 1 & 2 (bitboards)
+
+Ce script traite la grille de rouleaux sous forme de bitboards : chaque
+ligne est un entier Python dont le bit x vaut 1 si la case x contient
+un rouleau '@' (1 bit par case).
+
+Le test « moins de 4 voisins sur 8 » est réalisé pour toute une ligne à
+la fois par un additionneur « bit-sliced » : les 8 plans de voisins
+(lignes du dessus, courante et du dessous, décalées d'une case) sont
+additionnés dans des compteurs binaires à l'aide de XOR / AND.
+
+Les tours de suppression de la partie 2 sont des opérations sur des
+lignes entières ; seules les lignes proches d'un retrait sont recalculées
+au tour suivant.
+
+.. codeauthor:: Alexandre Condette <alexandre.condette@wanadoo.fr>
+"""
+
+# %% ========================================================================
+# Constantes
+BITS: dict = str.maketrans("@.", "10")    # Mapping case → bit
+# ===========================================================================
+
+# %% ========================================================================
+# Input data
+def get_input(day: int = 1, example: bool = False) -> list:
+    """
+    Lit le fichier d'input pour le jour donné.
+
+    :param day: numéro du jour AOC
+    :param example: si True, utilise le fichier example.txt sinon input.txt
+    :return: liste de lignes du fichier
+    :rtype: list
+    """
+    file = 'example.txt' if example else 'input.txt'
+    with open(f"./Day{day}/{file}", 'r', encoding='utf-8') as f:
+        return [line.rstrip('\n') for line in f]
+
+# ===========================================================================
+
+# %% ========================================================================
+# Bitboards
+def load_rows(data: list) -> tuple:
+    """
+    Convertit la grille en bitboards (un entier par ligne).
+
+    :param data: Liste brute des lignes d’input.
+    :return: (liste des lignes en bits, largeur de la grille)
+    :rtype: tuple
+    """
+    width = max((len(line) for line in data), default=0)
+    rows = []
+
+    for line in data:
+        # Le caractère x devient le bit x : on lit la ligne à l'envers
+        rows.append(int(line[::-1].translate(BITS) or "0", 2))
+
+    return rows, width
+
+# ---------------------------------------------------------------------------
+def accessible_row(above: int, row: int, below: int, mask: int) -> int:
+    """
+    Rouleaux de `row` ayant moins de 4 voisins, calculés en parallèle sur
+    toute la ligne.
+
+    Les 8 plans de voisins sont additionnés dans un compteur 2 bits
+    (ones, twos) ; `fours` mémorise tout débordement, c'est-à-dire un
+    total d'au moins 4 voisins.
+
+    :param above: ligne du dessus (0 hors grille)
+    :param row: ligne courante
+    :param below: ligne du dessous (0 hors grille)
+    :param mask: masque des colonnes valides
+    :return: bits des rouleaux accessibles
+    :rtype: int
+    """
+    ones = twos = fours = 0
+
+    for plane in ((above << 1) & mask, above, above >> 1,
+                  (row << 1) & mask, row >> 1,
+                  (below << 1) & mask, below, below >> 1):
+        carry = ones & plane
+        ones ^= plane
+        fours |= twos & carry
+        twos ^= carry
+
+    return row & ~fours
+
+# ---------------------------------------------------------------------------
+def accessible_rows(rows: list, width: int, indexes) -> dict:
+    """
+    Rouleaux accessibles pour un ensemble de lignes.
+
+    :param rows: lignes en bits
+    :param width: largeur de la grille
+    :param indexes: index des lignes à évaluer
+    :return: {index de ligne: bits accessibles} (lignes non vides)
+    :rtype: dict
+    """
+    mask = (1 << width) - 1
+    last = len(rows) - 1
+    accessible = {}
+
+    for y in indexes:
+        if not rows[y]:
+            continue
+
+        above = rows[y - 1] if y > 0 else 0
+        below = rows[y + 1] if y < last else 0
+        bits = accessible_row(above, rows[y], below, mask)
+        if bits:
+            accessible[y] = bits
+
+    return accessible
+
+# ===========================================================================
+
+# %% ========================================================================
+# Résolution
+def solve_part1(data: list) -> int:
+    """
+    Détermine le nombre de rouleaux accessibles dans la grille initiale.
+
+    :param data: Liste brute des lignes d’input.
+    :return: Nombre total de rouleaux accessibles.
+    :rtype: int
+    """
+    rows, width = load_rows(data)
+    accessible = accessible_rows(rows, width, range(len(rows)))
+
+    return sum(bits.bit_count() for bits in accessible.values())
+
+# ---------------------------------------------------------------------------
+def solve_part2(data: list) -> int:
+    """
+    Simule les suppressions successives des rouleaux accessibles jusqu'à
+    stabilisation, ligne entière par ligne entière.
+
+    Un retrait ne modifie le voisinage que des lignes adjacentes : seules
+    les lignes voisines d'un retrait sont réévaluées au tour suivant.
+
+    :param data: Liste brute des lignes d’input.
+    :return: Nombre total de rouleaux retirés.
+    :rtype: int
+    """
+    rows, width = load_rows(data)
+    dirty = set(range(len(rows)))
+    total_removed = 0
+
+    while dirty:
+        # Tous les rouleaux accessibles du tour sont évalués avant retrait
+        accessible = accessible_rows(rows, width, sorted(dirty))
+
+        dirty = set()
+        for y, bits in accessible.items():
+            rows[y] &= ~bits
+            total_removed += bits.bit_count()
+            dirty.update(i for i in (y - 1, y, y + 1) if 0 <= i < len(rows))
+
+    return total_removed
+
+# ===========================================================================
+
+# %%
+if __name__ == "__main__":
+    DATA = get_input(4, False)
+    RESULT_1 = solve_part1(DATA)
+    RESULT_2 = solve_part2(DATA)
+
+    print("\n" + "═" * 60)
+    print("   🔐 Advent of Code 2025 — Day 4 | Bitboards".center(60))
+    print("═" * 60)
+    print(f"Rouleaux accessibles : \033[96m{RESULT_1}\033[0m")
+    print(f"Rouleaux retirés : \033[96m{RESULT_2}\033[0m")
+    print("═" * 60 + "\n")
@@ -0,0 +1,147 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Advent Of Code 2025
+===================
+Day : 4
+Part : 1 (mode multi-processus)
+
+Ce script compte les rouleaux accessibles en répartissant la grille sur
+plusieurs processus :
+    - la grille est chargée une seule fois dans un segment de mémoire
+      partagée (1 octet par case), sans sérialiser de listes de lignes,
+    - chaque worker s'attache au segment et traite une bande de lignes,
+      en lisant une ligne de halo au-dessus et au-dessous,
+    - les comptes de chaque bande sont additionnés.
+
+Le test est local (8 voisins) : les bandes sont indépendantes et le
+débit croît avec le nombre de cœurs.
+
+.. codeauthor:: Alexandre Condette <alexandre.condette@wanadoo.fr>
+"""
+
+# %% ========================================================================
+# Imports
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+# ===========================================================================
+
+# %% ========================================================================
+# Constantes
+NEIGHBORS: list = [
+    (-1, -1), (-1, 0), (-1, 1),
+    (0, -1),           (0, 1),
+    (1, -1),  (1, 0), (1, 1)
+]
+THRESHOLD: int = 4        # Un rouleau est accessible sous ce nombre de voisins
+BAND_ROWS: int = 1024     # Nombre de lignes par bande
+# ===========================================================================
+
+# %% ========================================================================
+# Grille partagée
+def load_shared(path: str) -> tuple:
+    """
+    Charge la grille dans un segment de mémoire partagée (1 pour '@').
+
+    Le fichier est lu deux fois en flux : une première passe mesure la
+    grille (hauteur sans les lignes vides finales, largeur maximale) pour
+    dimensionner le segment, la seconde y copie chaque ligne dès sa lecture.
+
+    :param path: chemin du fichier de la grille
+    :return: (segment de mémoire partagée, forme (hauteur, largeur))
+    :rtype: tuple
+    """
+    height = width = 0
+    with open(path, 'rb') as f:
+        for y, row in enumerate(f, start=1):
+            row = row.rstrip(b"\r\n")
+            if row:
+                height, width = y, max(width, len(row))
+
+    shape = (height, width)
+    shm = shared_memory.SharedMemory(create=True, size=max(height * width, 1))
+    grid = np.ndarray(shape, dtype=np.uint8, buffer=shm.buf)
+
+    with open(path, 'rb') as f:
+        for y, row in zip(range(height), f):
+            row = row.rstrip(b"\r\n")
+            grid[y, :len(row)] = np.frombuffer(row, dtype=np.uint8) == ord("@")
+            grid[y, len(row):] = 0
+
+    del grid
+    return shm, shape
+
+# ---------------------------------------------------------------------------
+def count_band(name: str, shape: tuple, r0: int, r1: int) -> int:
+    """
+    Compte les rouleaux accessibles des lignes [r0, r1) (exécuté par un worker).
+
+    :param name: nom du segment de mémoire partagée
+    :param shape: forme (hauteur, largeur) de la grille
+    :param r0: première ligne de la bande
+    :param r1: ligne suivant la fin de la bande
+    :return: nombre de rouleaux accessibles de la bande
+    :rtype: int
+    """
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        grid = np.ndarray(shape, dtype=np.uint8, buffer=shm.buf)
+
+        # Bande avec une ligne de halo de chaque côté (vide hors grille)
+        height, width = r1 - r0, shape[1]
+        padded = np.zeros((height + 2, width + 2), dtype=np.uint8)
+        lo, hi = max(r0 - 1, 0), min(r1 + 1, shape[0])
+        padded[lo - r0 + 1:hi - r0 + 1, 1:-1] = grid[lo:hi]
+        del grid
+    finally:
+        shm.close()
+
+    counts = np.zeros((height, width), dtype=np.uint8)
+    for dy, dx in NEIGHBORS:
+        counts += padded[1 + dy:1 + dy + height, 1 + dx:1 + dx + width]
+
+    rolls = padded[1:-1, 1:-1].astype(bool)
+    return int(np.count_nonzero(rolls & (counts < THRESHOLD)))
+
+# ===========================================================================
+
+# %% ========================================================================
+# Résolution
+def solve(path: str, workers: int = None, band_rows: int = BAND_ROWS) -> int:
+    """
+    Détermine le nombre de rouleaux accessibles, bande par bande en parallèle.
+
+    :param path: chemin du fichier de la grille
+    :param workers: nombre de processus (par défaut : nombre de cœurs)
+    :param band_rows: nombre de lignes par bande
+    :return: Nombre total de rouleaux accessibles.
+    :rtype: int
+    """
+    shm, shape = load_shared(path)
+    try:
+        starts = list(range(0, shape[0], band_rows))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            counts = executor.map(count_band,
+                                  [shm.name] * len(starts),
+                                  [shape] * len(starts),
+                                  starts,
+                                  [min(r0 + band_rows, shape[0]) for r0 in starts])
+            return sum(counts)
+    finally:
+        shm.close()
+        shm.unlink()
+
+# ===========================================================================
+
+# %%
+if __name__ == "__main__":
+    RESULT = solve("./Day4/input.txt")
+
+    print("\n" + "═" * 60)
+    print("   🔐 Advent of Code 2025 — Day 4 | Parallèle".center(60))
+    print("═" * 60)
+    print(f"Rouleaux accessibles : \033[96m{RESULT}\033[0m")
+    print("═" * 60 + "\n")
@@ -21,7 +21,7 @@ Le résultat final correspond au nombre total de rouleaux retirés.
 
 # %% ========================================================================
 # Imports
-
+from array import array
 # ===========================================================================
 
 # %% =
@@ -31,6 +31,8 @@ NEIGHBORS: list = [
     (0, -1),           (0, 1),
     (1, -1),  (1, 0), (1, 1)
 ]
+NO_ROLL: int = -1     # Case sans rouleau dans la carte des tours
+SURVIVOR: int = 0     # Rouleau jamais retiré
 # ==
 # %% ========================================================================
 # Input data
@@ -49,6 +51,121 @@ def get_input(day: int = 1, example: bool = False) -> list:
 
 # ===========================================================================
 
+# %% ========================================================================
+# Carte des tours de retrait
+class RemovalRounds:
+    """
+    Carte compacte du tour de retrait de chaque case avec :
+    - une valeur par case (NO_ROLL, SURVIVOR, ou numéro du tour ≥ 1),
+    - les retraits par tour, le nombre de retraits après r tours,
+    - l'ensemble des rouleaux qui ne sont jamais retirés,
+    - sauvegarde / rechargement binaire.
+    """
+
+    def __init__(self, rounds: array, height: int, width: int):
+        self.rounds = rounds
+        self.height = height
+        self.width = width
+
+        # Nombre de retraits par tour (index 0 → tour 1)
+        self.per_round = [0] * max(rounds, default=0)
+        for r in rounds:
+            if r > 0:
+                self.per_round[r - 1] += 1
+
+    @classmethod
+    def from_grid(cls, data: list) -> "RemovalRounds":
+        """
+        Calcule, en une passe d'« épluchage » (comme un k-core), le tour de
+        retrait de chaque rouleau :
+        - le nombre de voisins de chaque rouleau est calculé une seule fois,
+        - au retrait d'un rouleau, on décrémente le compteur de ses voisins,
+        - seuls les voisins qui passent sous 4 sont mis en file pour le tour
+          suivant.
+
+        Les rouleaux d'un même tour sont retirés ensemble, comme dans la
+        simulation tour par tour. Le travail total est en O(rouleaux).
+        """
+        height = len(data)
+        width = max((len(line) for line in data), default=0)
+        rounds = array('i', [NO_ROLL]) * (height * width)
+
+        # --- Construction de l'ensemble des rouleaux "@"
+        paper_rolls = set()
+        for y, line in enumerate(data):
+            for x, c in enumerate(line):
+                if c == "@":
+                    paper_rolls.add((y, x))
+                    rounds[y * width + x] = SURVIVOR
+
+        # --- Nombre de voisins de chaque rouleau (calculé une seule fois)
+        neighbor_count = {}
+        for (y, x) in paper_rolls:
+            neighbor_count[(y, x)] = sum((y + dy, x + dx) in paper_rolls
+                                         for dy, dx in NEIGHBORS)
+
+        # Premier tour : les rouleaux accessibles dans la grille initiale
+        to_remove = [roll for roll, count in neighbor_count.items() if count < 4]
+        current_round = 0
+
+        while to_remove:
+            # Retirer tous les rouleaux accessibles en un tour
+            current_round += 1
+            for (y, x) in to_remove:
+                paper_rolls.discard((y, x))
+                rounds[y * width + x] = current_round
+
+            # Mise à jour des voisins restants ; seuls ceux qui passent
+            # sous 4 voisins seront retirés au tour suivant
+            next_round = []
+            for (y, x) in to_remove:
+                for dy, dx in NEIGHBORS:
+                    neighbor = (y + dy, x + dx)
+                    if neighbor in paper_rolls:
+                        neighbor_count[neighbor] -= 1
+                        if neighbor_count[neighbor] == 3:
+                            next_round.append(neighbor)
+
+            to_remove = next_round
+
+        return cls(rounds, height, width)
+
+    @property
+    def total_removed(self) -> int:
+        """Nombre total de rouleaux retirés."""
+        return sum(self.per_round)
+
+    def round_of(self, y: int, x: int) -> int:
+        """Tour de retrait de la case (y, x) : NO_ROLL, SURVIVOR ou r ≥ 1."""
+        return self.rounds[y * self.width + x]
+
+    def removed_after(self, r: int) -> int:
+        """Nombre de rouleaux retirés à l'issue des r premiers tours."""
+        return sum(self.per_round[:r])
+
+    def survivors(self) -> set:
+        """Positions (y, x) des rouleaux qui ne sont jamais retirés."""
+        return {divmod(i, self.width) for i, r in enumerate(self.rounds) if r == SURVIVOR}
+
+    def save(self, path: str) -> None:
+        """Sauvegarde la carte : dimensions puis tours, en binaire."""
+        with open(path, 'wb') as f:
+            array('i', [self.height, self.width]).tofile(f)
+            self.rounds.tofile(f)
+
+    @classmethod
+    def load(cls, path: str) -> "RemovalRounds":
+        """Recharge une carte sauvegardée par `save`."""
+        with open(path, 'rb') as f:
+            shape = array('i')
+            shape.fromfile(f, 2)
+            rounds = array('i')
+            rounds.fromfile(f, shape[0] * shape[1])
+
+        return cls(rounds, shape[0], shape[1])
+
+# ===========================================================================
+
 # %% ========================================================================
 # Résolution
 def solve(data: list) -> int:
@@ -56,41 +173,14 @@ def solve(data: list) -> int:
     Simule les suppressions successives des rouleaux accessibles (<4 voisins)
     jusqu'à stabilisation.
 
+    Le total est lu sur la carte des tours de retrait (`RemovalRounds`),
+    calculée en une seule passe d'épluchage.
+
     :param data: Liste brute des lignes d’input.
     :return: Nombre total de rouleaux retirés.
     :rtype: int
     """
-    # --- Construction de l'ensemble des rouleaux "@"
-    paper_rolls = set()
-    for y, line in enumerate(data):
-        for x, c in enumerate(line):
-            if c == "@":
-                paper_rolls.add((y, x))
-
-    total_removed = 0
-
-    while True:
-        to_remove = set()
-
-        # Identifier les rouleaux accessibles (moins de 4 voisins)
-        for (y, x) in paper_rolls:
-            neighbor_count = 0
-            for dy, dx in NEIGHBORS:
-                neighbor = (y + dy, x + dx)
-                if neighbor in paper_rolls:
-                    neighbor_count += 1
-            if neighbor_count < 4:
-                to_remove.add((y, x))
-
-        # Plus rien à retirer ? On a atteint la stabilité
-        if not to_remove:
-            break
-
-        # Retirer tous les rouleaux accessibles en un tour
-        paper_rolls -= to_remove
-        total_removed += len(to_remove)
-
-    return total_removed
+    return RemovalRounds.from_grid(data).total_removed
 
 # ===========================================================================
 
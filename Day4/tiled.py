@@ -0,0 +1,234 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Advent Of Code 2025
+===================
+Day : 4
+Part : 1 & 2 (traitement par bandes hors mémoire)
+
+Ce script traite des grilles plus grandes que la RAM disponible :
+    - le fichier est projeté en mémoire (np.memmap), sans être chargé,
+    - la grille est parcourue par bandes horizontales de `band_rows`
+      lignes, lues avec une ligne de halo au-dessus et au-dessous,
+    - la mémoire utilisée est bornée par la taille d'une bande.
+
+Partie 1 : les rouleaux accessibles sont comptés bande par bande.
+
+Partie 2 : les tours de suppression sont appliqués sur une copie de
+travail du fichier. Pendant un tour, un rouleau retiré est marqué 'x' :
+il compte encore comme voisin pour les bandes traitées ensuite, ce qui
+conserve la suppression simultanée de tous les rouleaux du tour. En fin
+de tour, les 'x' deviennent '.'. Seules les bandes touchées par des
+retraits (ou dont le halo l'a été) sont retraitées au tour suivant.
+
+.. codeauthor:: Alexandre Condette <alexandre.condette@wanadoo.fr>
+"""
+
+# %% ========================================================================
+# Imports
+import os
+import shutil
+import tempfile
+
+import numpy as np
+# ===========================================================================
+
+# %% ========================================================================
+# Constantes
+NEIGHBORS: list = [
+    (-1, -1), (-1, 0), (-1, 1),
+    (0, -1),           (0, 1),
+    (1, -1),  (1, 0), (1, 1)
+]
+THRESHOLD: int = 4        # Un rouleau est accessible sous ce nombre de voisins
+BAND_ROWS: int = 1024     # Nombre de lignes par bande
+
+ROLL: int = ord("@")      # Rouleau présent
+REMOVED: int = ord("x")   # Rouleau retiré pendant le tour en cours
+EMPTY: int = ord(".")     # Case vide
+# ===========================================================================
+
+# %% ========================================================================
+# Grille projetée en mémoire
+class TiledGrid:
+    """
+    Grille rectangulaire projetée en mémoire avec :
+    - lecture de bandes de lignes (complétées hors grille par des cases vides),
+    - écriture des cases d'une bande (copie de travail uniquement).
+    """
+
+    def __init__(self, path: str, writable: bool = False):
+        self.buffer = np.memmap(path, dtype=np.uint8, mode='r+' if writable else 'r')
+
+        # Largeur utile et pas entre deux lignes (\n ou \r\n) : on cherche
+        # la première fin de ligne par morceaux, sans parcourir tout le fichier
+        chunk = 1 << 16
+        first_end = bytes(self.buffer[:chunk]).find(b"\n")
+        while first_end == -1 and chunk < self.buffer.size:
+            chunk *= 2
+            first_end = bytes(self.buffer[:chunk]).find(b"\n")
+        if first_end == -1:
+            first_end = self.buffer.size
+        self.stride = first_end + 1
+        self.width = first_end - int(first_end > 0 and self.buffer[first_end - 1] == ord("\r"))
+        self.height = -(-self.buffer.size // self.stride)
+
+    def read(self, r0: int, r1: int) -> np.ndarray:
+        """Lignes [r0, r1) de la grille ; les lignes hors grille sont vides."""
+        band = np.full((r1 - r0, self.width), EMPTY, dtype=np.uint8)
+
+        lo, hi = max(r0, 0), min(r1, self.height)
+        if lo < hi:
+            raw = self.buffer[lo * self.stride:hi * self.stride]
+            if raw.size < (hi - lo) * self.stride:
+                # Dernière ligne sans fin de ligne
+                raw = np.concatenate((raw, np.full((hi - lo) * self.stride - raw.size,
+                                                   ord("\n"), dtype=np.uint8)))
+            band[lo - r0:hi - r0] = raw.reshape(hi - lo, self.stride)[:, :self.width]
+
+        return band
+
+    def write(self, r0: int, band: np.ndarray) -> None:
+        """Réécrit les lignes [r0, r0 + len(band)) de la grille."""
+        for i, row in enumerate(band):
+            start = (r0 + i) * self.stride
+            self.buffer[start:start + self.width] = row
+
+    def bands(self, band_rows: int) -> range:
+        """Index de départ des bandes de `band_rows` lignes."""
+        return range(0, self.height, band_rows)
+
+# ---------------------------------------------------------------------------
+def neighbor_counts(present: np.ndarray) -> np.ndarray:
+    """
+    Nombre de rouleaux parmi les 8 voisins des lignes intérieures d'une
+    bande lue avec son halo (première et dernière lignes).
+
+    :param present: cases occupées de la bande, halo compris
+    :return: nombre de voisins des lignes hors halo
+    :rtype: np.ndarray
+    """
+    height, width = present.shape[0] - 2, present.shape[1]
+    padded = np.pad(present, ((0, 0), (1, 1))).astype(np.uint8)
+    counts = np.zeros((height, width), dtype=np.uint8)
+
+    for dy, dx in NEIGHBORS:
+        counts += padded[1 + dy:1 + dy + height, 1 + dx:1 + dx + width]
+
+    return counts
+
+# ---------------------------------------------------------------------------
+def accessible_band(grid: TiledGrid, r0: int, r1: int) -> tuple:
+    """
+    Rouleaux accessibles des lignes [r0, r1), calculés avec une ligne de halo.
+
+    :param grid: grille projetée
+    :param r0: première ligne de la bande
+    :param r1: ligne suivant la fin de la bande
+    :return: (lignes de la bande, masque des rouleaux accessibles)
+    :rtype: tuple
+    """
+    band = grid.read(r0 - 1, r1 + 1)
+    present = (band == ROLL) | (band == REMOVED)
+
+    inner = band[1:-1]
+    accessible = (inner == ROLL) & (neighbor_counts(present) < THRESHOLD)
+
+    return inner, accessible
+
+# ===========================================================================
+
+# %% ========================================================================
+# Résolution
+def solve_part1(path: str, band_rows: int = BAND_ROWS) -> int:
+    """
+    Compte les rouleaux accessibles, bande par bande.
+
+    :param path: chemin du fichier de la grille
+    :param band_rows: nombre de lignes par bande
+    :return: Nombre total de rouleaux accessibles.
+    :rtype: int
+    """
+    grid = TiledGrid(path)
+    accessible_roll_count = 0
+
+    for r0 in grid.bands(band_rows):
+        r1 = min(r0 + band_rows, grid.height)
+        _, accessible = accessible_band(grid, r0, r1)
+        accessible_roll_count += int(np.count_nonzero(accessible))
+
+    return accessible_roll_count
+
+# ---------------------------------------------------------------------------
+def solve_part2(path: str, band_rows: int = BAND_ROWS, work_dir: str = None) -> int:
+    """
+    Simule les suppressions successives des rouleaux accessibles sur une
+    copie de travail du fichier, en ne retraitant que les bandes touchées.
+
+    :param path: chemin du fichier de la grille
+    :param band_rows: nombre de lignes par bande
+    :param work_dir: dossier de la copie de travail (par défaut : temporaire)
+    :return: Nombre total de rouleaux retirés.
+    :rtype: int
+    """
+    with tempfile.TemporaryDirectory(dir=work_dir) as tmp:
+        work_path = os.path.join(tmp, "grid.txt")
+        shutil.copyfile(path, work_path)
+
+        grid = TiledGrid(work_path, writable=True)
+        last_band = (grid.height - 1) // band_rows
+        dirty = set(range(last_band + 1))
+        total_removed = 0
+
+        while dirty:
+            touched = set()
+
+            # Marquage 'x' des rouleaux accessibles, bande par bande
+            for b in sorted(dirty):
+                r0 = b * band_rows
+                r1 = min(r0 + band_rows, grid.height)
+                inner, accessible = accessible_band(grid, r0, r1)
+                if not accessible.any():
+                    continue
+
+                inner = inner.copy()
+                inner[accessible] = REMOVED
+                grid.write(r0, inner)
+                total_removed += int(np.count_nonzero(accessible))
+
+                # Bandes dont le voisinage a changé (halo compris)
+                rows = np.flatnonzero(accessible.any(axis=1)) + r0
+                for y in (rows[0] - 1, r0, rows[-1] + 1):
+                    if 0 <= y < grid.height:
+                        touched.add(y // band_rows)
+
+            # Fin du tour : les rouleaux marqués sont effectivement retirés
+            for b in sorted(touched):
+                r0 = b * band_rows
+                r1 = min(r0 + band_rows, grid.height)
+                band = grid.read(r0, r1)
+                if (band == REMOVED).any():
+                    band[band == REMOVED] = EMPTY
+                    grid.write(r0, band)
+
+            dirty = touched
+
+        grid.buffer.flush()
+        del grid
+
+    return total_removed
+
+# ===========================================================================
+
+# %%
+if __name__ == "__main__":
+    RESULT_1 = solve_part1("./Day4/input.txt")
+    RESULT_2 = solve_part2("./Day4/input.txt")
+
+    print("\n" + "═" * 60)
+    print("   🔐 Advent of Code 2025 — Day 4 | Par bandes".center(60))
+    print("═" * 60)
+    print(f"Rouleaux accessibles : \033[96m{RESULT_1}\033[0m")
+    print(f"Rouleaux retirés : \033[96m{RESULT_2}\033[0m")
+    print("═" * 60 + "\n")
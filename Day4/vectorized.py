@@ -0,0 +1,131 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Advent Of Code 2025
+===================
+Day : 4
+Part : 1 (moteur NumPy)
+
+Ce script compte les rouleaux accessibles sur une grille dense :
+    - la grille est chargée en tableau booléen (True pour '@'),
+    - le nombre de voisins de chaque case est la somme des 8 vues
+      décalées de la grille (bordée de cases vides),
+    - les rouleaux accessibles (moins de 4 voisins) sont comptés par
+      un seul masque.
+
+.. codeauthor:: Alexandre Condette <alexandre.condette@wanadoo.fr>
+"""
+
+# %% ========================================================================
+# Imports
+import numpy as np
+# ===========================================================================
+
+# %% ========================================================================
+# Constantes
+NEIGHBORS: list = [
+    (-1, -1), (-1, 0), (-1, 1),
+    (0, -1),           (0, 1),
+    (1, -1),  (1, 0), (1, 1)
+]
+THRESHOLD: int = 4    # Un rouleau est accessible sous ce nombre de voisins
+# ===========================================================================
+
+# %% ========================================================================
+# Input data
+def get_input(day: int = 1, example: bool = False) -> bytes:
+    """
+    Lit le fichier d'input pour le jour donné, en octets bruts.
+
+    :param day: numéro du jour AOC
+    :param example: si True, utilise le fichier example.txt sinon input.txt
+    :return: contenu brut du fichier
+    :rtype: bytes
+    """
+    file = 'example.txt' if example else 'input.txt'
+    with open(f"./Day{day}/{file}", 'rb') as f:
+        return f.read()
+
+# ===========================================================================
+
+# %% ========================================================================
+# Grille dense
+def load_grid(data) -> np.ndarray:
+    """
+    Charge la grille en tableau booléen (True pour un rouleau '@').
+
+    Les lignes plus courtes sont complétées par des cases vides.
+
+    :param data: contenu brut (bytes) ou liste de lignes
+    :return: grille booléenne (hauteur, largeur)
+    :rtype: np.ndarray
+    """
+    if isinstance(data, (bytes, bytearray)):
+        rows = [row.rstrip(b"\r") for row in bytes(data).split(b"\n")]
+    else:
+        rows = [row.rstrip("\r\n").encode() for row in data]
+
+    # Suppression des lignes vides finales
+    while rows and not rows[-1]:
+        rows.pop()
+
+    width = max((len(row) for row in rows), default=0)
+    buffer = b"".join(row.ljust(width, b".") for row in rows)
+
+    return np.frombuffer(buffer, dtype=np.uint8).reshape(len(rows), width) == ord("@")
+
+# ---------------------------------------------------------------------------
+def neighbor_counts(grid: np.ndarray) -> np.ndarray:
+    """
+    Nombre de rouleaux parmi les 8 voisins de chaque case.
+
+    :param grid: grille booléenne
+    :return: nombre de voisins de chaque case
+    :rtype: np.ndarray
+    """
+    height, width = grid.shape
+    padded = np.pad(grid, 1).astype(np.uint8)
+    counts = np.zeros((height, width), dtype=np.uint8)
+
+    for dy, dx in NEIGHBORS:
+        counts += padded[1 + dy:1 + dy + height, 1 + dx:1 + dx + width]
+
+    return counts
+
+# ---------------------------------------------------------------------------
+def accessible_mask(grid: np.ndarray) -> np.ndarray:
+    """
+    Masque des rouleaux accessibles (moins de THRESHOLD voisins).
+
+    :param grid: grille booléenne
+    :return: masque des rouleaux accessibles
+    :rtype: np.ndarray
+    """
+    return grid & (neighbor_counts(grid) < THRESHOLD)
+
+# ===========================================================================
+
+# %% ========================================================================
+# Résolution
+def solve(data) -> int:
+    """
+    Détermine le nombre de rouleaux accessibles dans la grille initiale.
+
+    :param data: contenu brut (bytes) ou liste de lignes
+    :return: Nombre total de rouleaux accessibles.
+    :rtype: int
+    """
+    return int(np.count_nonzero(accessible_mask(load_grid(data))))
+
+# ===========================================================================
+
+# %%
+if __name__ == "__main__":
+    RESULT = solve(get_input(4, False))
+
+    print("\n" + "═" * 60)
+    print("   🔐 Advent of Code 2025 — Day 4 | Part 1 (NumPy)".center(60))
+    print("═" * 60)
+    print(f"Rouleaux accessibles : \033[96m{RESULT}\033[0m")
+    print("═" * 60 + "\n")
@@ -0,0 +1,174 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Advent Of Code 2025
+===================
+Day : 5
+Part : 1 & 2 (ensemble dynamique)
+
+Ce script maintient un catalogue d'intervalles "frais" modifiable : des
+lots peuvent être ajoutés ou rappelés à tout moment, et le total de la
+partie 2 reste disponible sans refusionner tous les intervalles.
+
+Le catalogue est un arbre de segments implicite sur [0, 2^bits) :
+    - les nœuds ne sont créés que le long des bornes des lots insérés,
+    - chaque nœud compte les lots qui le recouvrent entièrement (`cover`)
+      et la longueur couverte de son segment (`covered`),
+    - un nœud recouvert par au moins un lot est entièrement couvert ; sinon
+      sa longueur couverte est la somme de celles de ses enfants.
+
+Ajout, rappel et appartenance sont en O(bits) ; le total (longueur de
+l'union) est lu directement à la racine. Un ID reste frais tant qu'au
+moins un lot le contenant n'a pas été rappelé.
+
+.. codeauthor:: Alexandre Condette <alexandre.condette@wanadoo.fr>
+"""
+
+# %% ========================================================================
+# Imports
+from collections import Counter
+# ===========================================================================
+
+# %% ========================================================================
+# Constantes
+DOMAIN_BITS: int = 63     # IDs dans [0, 2^63), comme l'index int64
+# ===========================================================================
+
+# %% ========================================================================
+# Input data
+def get_input(day: int = 1, example: bool = False) -> list:
+    """
+    Lit le fichier d'input pour le jour donné.
+
+    :param day: numéro du jour AOC
+    :param example: si True, utilise le fichier example.txt sinon input.txt
+    :return: liste de lignes du fichier
+    :rtype: list
+    """
+    file = 'example.txt' if example else 'input.txt'
+    with open(f"./Day{day}/{file}", 'r', encoding='utf-8') as f:
+        return [line.rstrip('\n') for line in f]
+
+# ===========================================================================
+
+# %% ========================================================================
+# Ensemble dynamique
+class IntervalSet:
+    """
+    Ensemble d'intervalles modifiable avec :
+    - ajout et rappel de lots "start-stop" (bornes incluses),
+    - appartenance d'un ID,
+    - longueur de l'union (résultat de la partie 2) en O(1).
+    """
+
+    def __init__(self, bits: int = DOMAIN_BITS):
+        self.size = 1 << bits
+        self.lots = Counter()
+
+        # Nœuds stockés en colonnes ; 0 signifie « pas d'enfant »
+        # (la racine, d'index 0, n'est l'enfant d'aucun nœud)
+        self.left = [0]
+        self.right = [0]
+        self.cover = [0]
+        self.covered = [0]
+
+    @classmethod
+    def from_data(cls, data: list, bits: int = DOMAIN_BITS) -> "IntervalSet":
+        """Construit l'ensemble à partir des lignes "start-stop" de l'input."""
+        intervals = cls(bits)
+        for line in data:
+            if "-" in line:
+                intervals.add(*map(int, line.split("-")))
+
+        return intervals
+
+    @property
+    def total(self) -> int:
+        """Nombre total d'IDs frais (résultat de la partie 2)."""
+        return self.covered[0]
+
+    def add(self, start: int, stop: int) -> None:
+        """Ajoute le lot [start, stop]."""
+        self._check(start, stop)
+        self.lots[start, stop] += 1
+        self._update(0, 0, self.size, start, stop + 1, 1)
+
+    def remove(self, start: int, stop: int) -> None:
+        """Rappelle un lot [start, stop] précédemment ajouté."""
+        if not self.lots[start, stop]:
+            raise ValueError(f"Lot absent du catalogue : {start}-{stop}")
+
+        self.lots[start, stop] -= 1
+        if not self.lots[start, stop]:
+            del self.lots[start, stop]
+        self._update(0, 0, self.size, start, stop + 1, -1)
+
+    def __contains__(self, id: int) -> bool:
+        """True si l'ID appartient à au moins un lot."""
+        if not 0 <= id < self.size:
+            return False
+
+        # Un ID est frais si un nœud recouvert se trouve sur son chemin
+        node, lo, hi = 0, 0, self.size
+        while not self.cover[node]:
+            mid = (lo + hi) // 2
+            if id < mid:
+                node, hi = self.left[node], mid
+            else:
+                node, lo = self.right[node], mid
+
+            if not node:
+                return False
+
+        return True
+
+    def _check(self, start: int, stop: int) -> None:
+        """Vérifie que [start, stop] est un intervalle du domaine."""
+        if not 0 <= start <= stop < self.size:
+            raise ValueError(f"Intervalle invalide : {start}-{stop}")
+
+    def _child(self, node: int, side: list) -> int:
+        """Enfant gauche ou droit (`side`) du nœud, créé au besoin."""
+        if not side[node]:
+            side[node] = len(self.cover)
+            self.left.append(0)
+            self.right.append(0)
+            self.cover.append(0)
+            self.covered.append(0)
+
+        return side[node]
+
+    def _update(self, node: int, lo: int, hi: int, start: int, stop: int, delta: int) -> None:
+        """Ajoute `delta` au recouvrement de [start, stop) dans le segment [lo, hi)."""
+        if start <= lo and hi <= stop:
+            self.cover[node] += delta
+        else:
+            mid = (lo + hi) // 2
+            if start < mid:
+                self._update(self._child(node, self.left), lo, mid, start, stop, delta)
+            if stop > mid:
+                self._update(self._child(node, self.right), mid, hi, start, stop, delta)
+
+        if self.cover[node]:
+            self.covered[node] = hi - lo
+        else:
+            left, right = self.left[node], self.right[node]
+            self.covered[node] = (self.covered[left] if left else 0) \
+                + (self.covered[right] if right else 0)
+
+# ===========================================================================
+
+# %%
+if __name__ == "__main__":
+    DATA = get_input(5, False)
+    INTERVALS = IntervalSet.from_data(DATA)
+    RESULT_1 = sum(int(line) in INTERVALS for line in DATA if line and "-" not in line)
+    RESULT_2 = INTERVALS.total
+
+    print("\n" + "═" * 60)
+    print("   🔐 Advent of Code 2025 — Day 5 | Ensemble dynamique".center(60))
+    print("═" * 60)
+    print(f"Ingrédients frais (partie 1) : \033[96m{RESULT_1}\033[0m")
+    print(f"Ingrédients frais (partie 2) : \033[96m{RESULT_2}\033[0m")
+    print("═" * 60 + "\n")
@@ -0,0 +1,236 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Advent Of Code 2025
+===================
+Day : 5
+Part : 2 (fusion externe)
+
+Ce script calcule le total de la partie 2 pour des catalogues
+d'intervalles trop volumineux pour tenir en mémoire sous forme de tuples :
+    1. les intervalles sont lus en flux et regroupés en « runs » d'au plus
+       `run_size` intervalles, triés puis écrits dans des fichiers
+       temporaires sous forme de paires (start, stop) int64 compactes,
+    2. les runs sont relus par blocs et fusionnés (k-way merge) dans
+       l'ordre des débuts, au plus `fan_in` runs à la fois : tant qu'il
+       reste plus de `fan_in` runs, chaque groupe est fusionné en un run
+       intermédiaire (passes successives),
+    3. les intervalles qui se chevauchent ou sont contigus sont fusionnés
+       à la volée (règle `start > stop_courant + 1`) et le total est
+       accumulé sans jamais matérialiser la liste fusionnée.
+
+La mémoire est bornée par `run_size` intervalles dans les deux phases :
+pendant une fusion, chacun des `fan_in` runs ouverts et le run écrit
+disposent d'un bloc de `run_size // (fan_in + 1)` paires. Au plus
+`fan_in + 1` fichiers sont ouverts simultanément.
+
+.. codeauthor:: Alexandre Condette <alexandre.condette@wanadoo.fr>
+"""
+
+# %% ========================================================================
+# Imports
+import heapq
+import os
+import tempfile
+from array import array
+# ===========================================================================
+
+# %% ========================================================================
+# Constantes
+RUN_SIZE: int = 1 << 20       # Intervalles par run trié
+FAN_IN: int = 64              # Runs fusionnés au plus par passe
+# ===========================================================================
+
+# %% ========================================================================
+# Runs triés
+def iter_intervals(path: str):
+    """
+    Lit en flux les intervalles "start-stop" du fichier (les autres lignes
+    sont ignorées).
+
+    :param path: chemin du fichier d'entrée
+    :return: générateur de tuples (start, stop)
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if "-" in line:
+                start, stop = line.split("-")
+                yield int(start), int(stop)
+
+# ---------------------------------------------------------------------------
+def write_pairs(pairs, path: str, block_pairs: int) -> str:
+    """
+    Écrit un flux de paires (start, stop) en int64, par blocs.
+
+    :param pairs: itérable de tuples (start, stop)
+    :param path: chemin du fichier à écrire
+    :param block_pairs: nombre de paires mises en tampon avant écriture
+    :return: chemin du fichier écrit
+    :rtype: str
+    """
+    with open(path, 'wb') as f:
+        packed = array('q')
+        for start, stop in pairs:
+            packed.append(start)
+            packed.append(stop)
+            if len(packed) >= 2 * block_pairs:
+                packed.tofile(f)
+                packed = array('q')
+        packed.tofile(f)
+
+    return path
+
+# ---------------------------------------------------------------------------
+def write_run(intervals: list, directory: str, number: int) -> str:
+    """
+    Trie un lot d'intervalles et l'écrit en paires int64 (start, stop).
+
+    :param intervals: lot de tuples (start, stop)
+    :param directory: dossier des fichiers temporaires
+    :param number: numéro du run
+    :return: chemin du fichier écrit
+    :rtype: str
+    """
+    intervals.sort()
+    path = os.path.join(directory, f"run_{number:06d}.bin")
+
+    return write_pairs(intervals, path, max(1, len(intervals)))
+
+# ---------------------------------------------------------------------------
+def write_runs(intervals, directory: str, run_size: int = RUN_SIZE) -> list:
+    """
+    Découpe un flux d'intervalles en runs triés d'au plus `run_size` éléments.
+
+    :param intervals: itérable de tuples (start, stop)
+    :param directory: dossier des fichiers temporaires
+    :param run_size: nombre maximal d'intervalles en mémoire
+    :return: chemins des runs écrits
+    :rtype: list
+    """
+    runs = []
+    batch = []
+
+    for interval in intervals:
+        batch.append(interval)
+        if len(batch) >= run_size:
+            runs.append(write_run(batch, directory, len(runs)))
+            batch = []
+
+    if batch:
+        runs.append(write_run(batch, directory, len(runs)))
+
+    return runs
+
+# ---------------------------------------------------------------------------
+def read_run(path: str, block_pairs: int):
+    """
+    Relit un run trié par blocs de paires int64.
+
+    :param path: chemin du run
+    :param block_pairs: nombre de paires lues par bloc
+    :return: générateur de tuples (start, stop), dans l'ordre du run
+    """
+    with open(path, 'rb') as f:
+        while True:
+            block = array('q')
+            block.frombytes(f.read(16 * block_pairs))
+            if not block:
+                return
+
+            yield from zip(block[::2], block[1::2])
+
+# ===========================================================================
+
+# %% ========================================================================
+# Résolution
+def iter_merged(runs: list, block_pairs: int):
+    """
+    Fusionne (k-way merge) des runs triés en intervalles disjoints.
+
+    :param runs: chemins des runs triés (tous ouverts simultanément)
+    :param block_pairs: nombre de paires lues par bloc et par run
+    :return: générateur d'intervalles fusionnés (start, stop), triés
+    """
+    current = None
+
+    for start, stop in heapq.merge(*(read_run(run, block_pairs) for run in runs)):
+        if current is None:
+            current = [start, stop]
+        elif start > current[1] + 1:
+            yield tuple(current)
+            current = [start, stop]
+        else:
+            current[1] = max(current[1], stop)
+
+    if current is not None:
+        yield tuple(current)
+
+# ---------------------------------------------------------------------------
+def reduce_runs(runs: list, directory: str, fan_in: int, block_pairs: int) -> list:
+    """
+    Fusionne les runs par groupes de `fan_in` jusqu'à en avoir au plus
+    `fan_in` ; les runs intermédiaires contiennent des intervalles déjà
+    fusionnés et les runs consommés sont supprimés.
+
+    :param runs: chemins des runs triés
+    :param directory: dossier des fichiers temporaires
+    :param fan_in: nombre maximal de runs fusionnés à la fois
+    :param block_pairs: taille des blocs de lecture et d'écriture
+    :return: chemins des runs restants (au plus `fan_in`)
+    :rtype: list
+    """
+    number = len(runs)
+
+    while len(runs) > fan_in:
+        merged_runs = []
+        for i in range(0, len(runs), fan_in):
+            group = runs[i:i + fan_in]
+            path = os.path.join(directory, f"run_{number:06d}.bin")
+            merged_runs.append(write_pairs(iter_merged(group, block_pairs), path, block_pairs))
+            number += 1
+
+            for run in group:
+                os.remove(run)
+
+        runs = merged_runs
+
+    return runs
+
+# ---------------------------------------------------------------------------
+def solve(path: str, run_size: int = RUN_SIZE, work_dir: str = None,
+          fan_in: int = FAN_IN) -> int:
+    """
+    Calcule le nombre total d'identifiants présents dans les intervalles
+    par tri externe puis fusion en flux.
+
+    :param path: chemin du fichier d'entrée
+    :param run_size: nombre maximal d'intervalles en mémoire (tri et fusion)
+    :param work_dir: dossier des runs temporaires (par défaut : temporaire)
+    :param fan_in: nombre maximal de runs fusionnés à la fois (≥ 2)
+    :return: Nombre total d'identifiants présents dans les intervalles.
+    :rtype: int
+    """
+    if fan_in < 2:
+        raise ValueError(f"fan_in doit valoir au moins 2 : {fan_in}")
+
+    # Budget de `run_size` paires partagé entre les runs lus et le run écrit
+    block_pairs = max(1, run_size // (fan_in + 1))
+
+    with tempfile.TemporaryDirectory(dir=work_dir) as directory:
+        runs = write_runs(iter_intervals(path), directory, run_size)
+        runs = reduce_runs(runs, directory, fan_in, block_pairs)
+
+        return sum(stop - start + 1 for start, stop in iter_merged(runs, block_pairs))
+
+# ===========================================================================
+
+# %%
+if __name__ == "__main__":
+    RESULT = solve("./Day5/input.txt")
+
+    print("\n" + "═" * 60)
+    print("   🔐 Advent of Code 2025 — Day 5 | Fusion externe".center(60))
+    print("═" * 60)
+    print(f"Ingrédients frais : \033[96m{RESULT}\033[0m")
+    print("═" * 60 + "\n")
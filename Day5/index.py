@@ -0,0 +1,184 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Advent Of Code 2025
+===================
+Day : 5
+Part : 1 & 2 (index persistant)
+
+Ce script construit un index binaire du catalogue d'intervalles "frais",
+à réutiliser pour de nombreux lots d'identifiants sans re-parser ni
+re-fusionner les intervalles à chaque exécution.
+
+Format du fichier (entiers little-endian) :
+    - en-tête de 64 octets : signature, version, nombre n d'intervalles
+      fusionnés, empreinte SHA-256 du contenu,
+    - starts[n]      : débuts des intervalles fusionnés (int64, triés),
+    - stops[n]       : fins des intervalles fusionnés (int64),
+    - cumul[n + 1]   : nombre d'IDs frais avant chaque intervalle (int64).
+
+Le chargement projette le fichier en mémoire (mmap) sans copie : son coût
+ne dépend pas de la taille du catalogue. Les requêtes (appartenance,
+nombre d'IDs frais dans [a, b], total de la partie 2) sont en O(log n).
+
+.. codeauthor:: Alexandre Condette <alexandre.condette@wanadoo.fr>
+"""
+
+# %% ========================================================================
+# Imports
+import hashlib
+import mmap
+import struct
+from array import array
+from bisect import bisect_right
+
+try:
+    from Day5.part2 import merge_intervals
+except ImportError:     # Exécution directe : python Day5/index.py
+    from part2 import merge_intervals
+# ===========================================================================
+
+# %% ========================================================================
+# Constantes
+MAGIC: bytes = b"AOC5IDX\0"          # Signature du fichier
+VERSION: int = 1                     # Version du format
+HEADER = struct.Struct("<8sIIQ32s")  # signature, version, réservé, n, SHA-256
+HEADER_SIZE: int = 64                # En-tête complété pour aligner les données
+# ===========================================================================
+
+# %% ========================================================================
+# Input data
+def get_input(day: int = 1, example: bool = False) -> list:
+    """
+    Lit le fichier d'input pour le jour donné.
+
+    :param day: numéro du jour AOC
+    :param example: si True, utilise le fichier example.txt sinon input.txt
+    :return: liste de lignes du fichier
+    :rtype: list
+    """
+    file = 'example.txt' if example else 'input.txt'
+    with open(f"./Day{day}/{file}", 'r', encoding='utf-8') as f:
+        return [line.rstrip('\n') for line in f]
+
+# ===========================================================================
+
+# %% ========================================================================
+# Construction
+def build_index(data: list, path: str) -> int:
+    """
+    Construit le fichier d'index à partir des intervalles "start-stop".
+
+    :param data: Liste brute des lignes du fichier.
+    :param path: chemin du fichier d'index à écrire
+    :return: nombre d'intervalles fusionnés
+    :rtype: int
+    """
+    intervals = [tuple(map(int, line.split("-"))) for line in data if "-" in line]
+    merged = merge_intervals(intervals)
+
+    starts = array('q', (start for start, _ in merged))
+    stops = array('q', (stop for _, stop in merged))
+    cumul = array('q', [0])
+    for start, stop in merged:
+        cumul.append(cumul[-1] + stop - start + 1)
+
+    payload = starts.tobytes() + stops.tobytes() + cumul.tobytes()
+    header = HEADER.pack(MAGIC, VERSION, 0, len(merged), hashlib.sha256(payload).digest())
+
+    with open(path, 'wb') as f:
+        f.write(header.ljust(HEADER_SIZE, b"\0"))
+        f.write(payload)
+
+    return len(merged)
+
+# ===========================================================================
+
+# %% ========================================================================
+# Index projeté en mémoire
+class IntervalIndex:
+    """
+    Index d'intervalles projeté en mémoire avec :
+    - chargement sans copie (vues sur le mmap),
+    - appartenance d'un ID, nombre d'IDs frais dans [a, b],
+    - total des IDs frais (partie 2).
+    """
+
+    def __init__(self, path: str, verify: bool = False):
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, _, n, digest = HEADER.unpack_from(self._mmap)
+        if magic != MAGIC or version != VERSION:
+            self._mmap.close()
+            raise ValueError(f"Fichier d'index invalide : {path}")
+
+        self._view = memoryview(self._mmap)[HEADER_SIZE:]
+        if verify and hashlib.sha256(self._view).digest() != digest:
+            self.close()
+            raise ValueError(f"Empreinte du fichier d'index incorrecte : {path}")
+
+        words = self._view.cast('q')
+        self.starts = words[:n]
+        self.stops = words[n:2 * n]
+        self.cumul = words[2 * n:3 * n + 1]
+
+    def __enter__(self) -> "IntervalIndex":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Libère les vues puis le mmap."""
+        for view in (self.__dict__.pop(name, None)
+                     for name in ("starts", "stops", "cumul")):
+            if view is not None:
+                view.release()
+        self._view.release()
+        self._mmap.close()
+
+    @property
+    def total(self) -> int:
+        """Nombre total d'IDs frais (résultat de la partie 2)."""
+        return self.cumul[len(self.starts)]
+
+    def contains(self, id: int) -> bool:
+        """True si l'ID appartient à l'un des intervalles."""
+        i = bisect_right(self.starts, id) - 1
+        return i >= 0 and id <= self.stops[i]
+
+    def fresh_until(self, x: int) -> int:
+        """Nombre d'IDs frais inférieurs ou égaux à x."""
+        i = bisect_right(self.starts, x) - 1
+        if i < 0:
+            return 0
+
+        return self.cumul[i] + min(x, self.stops[i]) - self.starts[i] + 1
+
+    def count_fresh(self, start: int, stop: int) -> int:
+        """Nombre d'IDs frais dans [start, stop] (0 si l'intervalle est vide)."""
+        if start > stop:
+            return 0
+
+        return self.fresh_until(stop) - self.fresh_until(start - 1)
+
+# ===========================================================================
+
+# %%
+if __name__ == "__main__":
+    DATA = get_input(5, False)
+    build_index(DATA, "./Day5/index.bin")
+
+    with IntervalIndex("./Day5/index.bin", verify=True) as INDEX:
+        RESULT_1 = sum(INDEX.contains(int(line)) for line in DATA
+                       if line and "-" not in line)
+        RESULT_2 = INDEX.total
+
+    print("\n" + "═" * 60)
+    print("   🔐 Advent of Code 2025 — Day 5 | Index".center(60))
+    print("═" * 60)
+    print(f"Ingrédients frais (partie 1) : \033[96m{RESULT_1}\033[0m")
+    print(f"Ingrédients frais (partie 2) : \033[96m{RESULT_2}\033[0m")
+    print("═" * 60 + "\n")
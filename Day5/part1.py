@@ -16,12 +16,28 @@ dès qu'il appartient à au moins un intervalle présent dans la liste.
 
 La logique se base sur :
 - l'extraction de tous les intervalles "start-stop",
-- la vérification de chaque identifiant individuel pour déterminer s'il est
-  inclus dans l'un des intervalles collectés.
+- leur fusion en intervalles disjoints triés (même logique que la partie 2),
+- la classification de tous les identifiants par recherche dichotomique
+  dans les débuts d'intervalles (`searchsorted` vectorisé si NumPy est
+  disponible, `bisect` sinon).
 
 .. codeauthor:: Alexandre Condette <alexandre.condette@wanadoo.fr>
 """
 
+# %% ========================================================================
+# Imports
+from bisect import bisect_right
+
+try:
+    import numpy as np
+except ImportError:  # NumPy absent : repli sur bisect
+    np = None
+
+try:
+    from Day5.part2 import merge_intervals
+except ImportError:     # Exécution directe : python Day5/part1.py
+    from part2 import merge_intervals
+# ===========================================================================
 
 # %% ========================================================================
 # Input data
@@ -42,6 +58,48 @@ def get_input(day: int = 1, example: bool = False) -> list:
 
 # %% ========================================================================
 # Résolution
+def count_fresh(ids, intervals: list, return_mask: bool = False,
+                use_numpy: bool = True):
+    """
+    Compte les identifiants appartenant à au moins un intervalle.
+
+    Les intervalles sont fusionnés en bornes triées `starts` / `stops`.
+    Pour chaque ID, l'intervalle candidat est le dernier dont le début est
+    ≤ ID (recherche dichotomique) ; l'ID est frais s'il ne dépasse pas sa
+    fin. Coût en O((IDs + intervalles) log intervalles).
+
+    :param ids: identifiants à classer (séquence, tableau ou itérable)
+    :param intervals: liste de tuples (start, stop)
+    :param return_mask: si True, retourne aussi le masque par identifiant
+    :param use_numpy: si False, force le repli pur Python (bisect)
+    :return: nombre d'IDs frais, ou (nombre, masque) si `return_mask`
+    """
+    merged = merge_intervals(intervals)
+    starts = [start for start, _ in merged]
+    stops = [stop for _, stop in merged]
+
+    if np is not None and use_numpy:
+        # Séquence ou tableau : conversion directe ; itérable : lecture en flux
+        if hasattr(ids, "__len__"):
+            ids = np.asarray(ids, dtype=np.int64)
+        else:
+            ids = np.fromiter(ids, dtype=np.int64)
+        index = np.searchsorted(np.asarray(starts, dtype=np.int64), ids, side='right')
+
+        # Sentinelle en tête : un ID avant tout intervalle n'est jamais frais
+        bounds = np.asarray([np.iinfo(np.int64).min] + stops, dtype=np.int64)
+        mask = ids <= bounds[index]
+        fresh = int(np.count_nonzero(mask))
+    else:
+        mask = []
+        for id in ids:
+            index = bisect_right(starts, id) - 1
+            mask.append(index >= 0 and id <= stops[index])
+        fresh = sum(mask)
+
+    return (fresh, mask) if return_mask else fresh
+
+# ---------------------------------------------------------------------------
 def solve(data: list) -> int:
     """
      Analyse les lignes d'input et calcule le nombre d'identifiants individuels 
@@ -51,35 +109,26 @@ def solve(data: list) -> int:
     - Première section : plusieurs lignes au format "start-stop".
     - Deuxième section : des identifiants uniques, un par ligne.
 
-    Pour chaque identifiant rencontré, le script vérifie s'il appartient à 
-    l'une des plages collectées. Dès qu'un intervalle contient l'ID, il est 
-    comptabilisé et la recherche pour cet ID s'arrête.
+    Les intervalles sont fusionnés, puis tous les identifiants sont classés
+    en une passe par recherche dichotomique (`count_fresh`).
 
     :param data: Liste brute des lignes du fichier.
     :return: Nombre d'identifiants appartenant à au moins un intervalle.
     :rtype: int
     """
-    fresh: int = 0
     intervals: list = []
+    ids: list = []
 
-    # 1. Collecte des intervalles
+    # 1. Collecte des intervalles et des IDs uniques
     for line in data:
         if "-" in line:
             start, stop = map(int, line.split("-"))
             intervals.append((start, stop))
+        elif line:
+            ids.append(int(line))
 
-    # 2. Vérification des IDs uniques
-    for line in data:
-        if "-" not in line and line:
-            id = int(line)
-            
-            # Test d'appartenance à l'un des intervalles
-            for start, stop in intervals:
-                if start <= id <= stop:
-                    fresh += 1
-                    break
-
-    return fresh
+    # 2. Classification de tous les IDs
+    return count_fresh(ids, intervals)
 
 # ===========================================================================
 
@@ -41,6 +41,24 @@ def get_input(day: int = 1, example: bool = False) -> list:
 
 # %% ========================================================================
 # Résolution
+def merge_intervals(intervals: list) -> list:
+    """
+    Trie puis fusionne les intervalles qui se chevauchent ou sont contigus.
+
+    :param intervals: liste de tuples (start, stop)
+    :return: liste triée d'intervalles [start, stop] disjoints
+    :rtype: list
+    """
+    merged = []
+    for start, stop in sorted(intervals):
+        if not merged or start > merged[-1][1] + 1:
+            merged.append([start, stop])
+        else:
+            merged[-1][1] = max(merged[-1][1], stop)
+
+    return merged
+
+# ---------------------------------------------------------------------------
 def solve(data: list) -> int:
     """
      Calcule le nombre total d'identifiants inclus dans les intervalles.
@@ -70,16 +88,8 @@ def solve(data: list) -> int:
         else:
             continue # On arrête à la fin de la section des intervalles
 
-    # 2. Tri des intervalles
-    intervals.sort()
-
-    # 3. Fusion des intervalles
-    merged = []
-    for start, stop in intervals:
-        if not merged or start > merged[-1][1] + 1:
-            merged.append([start, stop])
-        else:
-            merged[-1][1] = max(merged[-1][1], stop)
+    # 2 & 3. Tri puis fusion des intervalles
+    merged = merge_intervals(intervals)
 
     # 4. Calcul du nombre total d'identifiants
     fresh = sum(stop - start + 1 for start, stop in merged)
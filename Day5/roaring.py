@@ -0,0 +1,480 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Advent Of Code 2025
+===================
+Day : 5
+Part : 1 & 2 (bitmap compressé)
+
+Ce script représente le catalogue d'IDs "frais" par un bitmap compressé
+de type Roaring, adapté aux catalogues faits de très nombreux intervalles
+courts et denses :
+    - l'espace des IDs est découpé en blocs de 2^16 valeurs, indexés par
+      les bits de poids fort de l'ID (`id >> 16`),
+    - chaque bloc non vide est un conteneur encodé de la façon la plus
+      compacte parmi :
+        * tableau trié de positions (uint16) si au plus 4096 IDs,
+        * bitmap de 65536 bits (8 Ko) sinon,
+        * suite de plages [début, fin] si moins coûteuse que les deux autres.
+
+Appartenance et cardinalité sont calculées conteneur par conteneur, et
+l'union ou l'intersection de deux catalogues se fait bloc à bloc selon
+les encodages des deux conteneurs : fusion de positions triées, balayage
+de plages, test de bits, ou opérations binaires sur les entiers Python
+lorsqu'un bitmap est en jeu.
+
+La mémoire est proportionnelle au nombre de blocs touchés : les
+intervalles très larges (des milliards de blocs) restent du ressort des
+listes d'intervalles fusionnés (`part2.py`, `index.py`).
+
+.. codeauthor:: Alexandre Condette <alexandre.condette@wanadoo.fr>
+"""
+
+# %% ========================================================================
+# Imports
+import heapq
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from itertools import groupby
+from typing import NamedTuple
+
+try:
+    from Day5.part2 import merge_intervals
+except ImportError:     # Exécution directe : python Day5/roaring.py
+    from part2 import merge_intervals
+# ===========================================================================
+
+# %% ========================================================================
+# Constantes
+BLOCK_BITS: int = 16                  # Bits de poids faible d'un conteneur
+BLOCK_SIZE: int = 1 << BLOCK_BITS     # IDs par conteneur
+LOW_MASK: int = BLOCK_SIZE - 1        # Position d'un ID dans son conteneur
+ARRAY_MAX: int = 4096                 # Au-delà, le bitmap est plus compact
+BITMAP_BYTES: int = BLOCK_SIZE // 8   # Taille d'un conteneur bitmap
+
+ARRAY: str = "array"                  # Tableau trié de positions
+BITMAP: str = "bitmap"                # Bitmap de 65536 bits
+RUN: str = "run"                      # Plages [début, fin]
+
+KIND_ORDER: dict = {ARRAY: 0, RUN: 1, BITMAP: 2}   # Ordre des opérandes
+# ===========================================================================
+
+# %% ========================================================================
+# Input data
+def get_input(day: int = 1, example: bool = False) -> list:
+    """
+    Lit le fichier d'input pour le jour donné.
+
+    :param day: numéro du jour AOC
+    :param example: si True, utilise le fichier example.txt sinon input.txt
+    :return: liste de lignes du fichier
+    :rtype: list
+    """
+    file = 'example.txt' if example else 'input.txt'
+    with open(f"./Day{day}/{file}", 'r', encoding='utf-8') as f:
+        return [line.rstrip('\n') for line in f]
+
+# ===========================================================================
+
+# %% ========================================================================
+# Conteneurs
+class Container(NamedTuple):
+    """
+    Conteneur d'un bloc de 2^16 IDs :
+    - ARRAY : array('H') trié des positions,
+    - BITMAP : entier dont le bit i vaut 1 si la position i est présente,
+    - RUN : (débuts, fins) des plages, deux array('H') triés.
+    """
+    kind: str
+    data: object
+    cardinality: int
+
+# ---------------------------------------------------------------------------
+def encoding(cardinality: int, runs: int) -> str:
+    """
+    Choisit l'encodage le plus compact d'un conteneur.
+
+    :param cardinality: nombre d'IDs du conteneur
+    :param runs: nombre de plages d'IDs consécutifs
+    :return: ARRAY, BITMAP ou RUN
+    :rtype: str
+    """
+    # Tailles en octets : 4 par plage, 2 par position, 8 Ko pour le bitmap
+    if 4 * runs < min(2 * cardinality, BITMAP_BYTES):
+        return RUN
+
+    return ARRAY if cardinality <= ARRAY_MAX else BITMAP
+
+# ---------------------------------------------------------------------------
+def bit_positions(bits: int) -> list:
+    """Positions triées des bits à 1 d'un bitmap de bloc, octet par octet."""
+    lows = []
+    for i, byte in enumerate(bits.to_bytes(BITMAP_BYTES, 'little')):
+        while byte:
+            bit = byte & -byte
+            lows.append(i << 3 | bit.bit_length() - 1)
+            byte ^= bit
+
+    return lows
+
+# ---------------------------------------------------------------------------
+def position_runs(lows: list) -> tuple:
+    """(débuts, fins) des plages de positions consécutives de `lows` (trié)."""
+    if not lows:
+        return [], []
+
+    # Une plage commence à chaque position non contiguë à la précédente
+    breaks = [i for i in range(1, len(lows)) if lows[i] != lows[i - 1] + 1]
+    starts = [lows[0]] + [lows[i] for i in breaks]
+    lasts = [lows[i - 1] for i in breaks] + [lows[-1]]
+
+    return starts, lasts
+
+# ---------------------------------------------------------------------------
+def run_bits(starts: list, lasts: list) -> int:
+    """Bitmap (entier) des plages disjointes [début, fin] d'un bloc."""
+    bitmap = bytearray(BITMAP_BYTES)
+
+    for start, last in zip(starts, lasts):
+        head, tail = start >> 3, last >> 3
+        head_mask = 0xFF << (start & 7) & 0xFF
+        tail_mask = 0xFF >> (7 - (last & 7))
+
+        # Octets de bord complétés par OU (ils peuvent être partagés)
+        if head == tail:
+            bitmap[head] |= head_mask & tail_mask
+        else:
+            bitmap[head] |= head_mask
+            bitmap[head + 1:tail] = b"\xff" * (tail - head - 1)
+            bitmap[tail] |= tail_mask
+
+    return int.from_bytes(bitmap, 'little')
+
+# ---------------------------------------------------------------------------
+def from_bits(bits: int) -> Container:
+    """
+    Encode un bitmap de bloc dans le conteneur le plus compact.
+
+    :param bits: entier dont le bit i vaut 1 si la position i est présente
+    :return: conteneur, ou None si aucun ID n'est présent
+    :rtype: Container
+    """
+    cardinality = bits.bit_count()
+    if not cardinality:
+        return None
+
+    # Début de plage : bit à 1 précédé d'un 0 ; fin : bit à 1 suivi d'un 0
+    firsts = bits & ~(bits << 1)
+    kind = encoding(cardinality, firsts.bit_count())
+
+    if kind == BITMAP:
+        return Container(BITMAP, bits, cardinality)
+
+    if kind == ARRAY:
+        return Container(ARRAY, array('H', bit_positions(bits)), cardinality)
+
+    starts = array('H', bit_positions(firsts))
+    lasts = array('H', bit_positions(bits & ~(bits >> 1)))
+
+    return Container(RUN, (starts, lasts), cardinality)
+
+# ---------------------------------------------------------------------------
+def from_runs(starts: list, lasts: list) -> Container:
+    """
+    Encode des plages disjointes, triées et non contiguës d'un bloc.
+
+    :param starts: débuts des plages
+    :param lasts: fins (incluses) des plages
+    :return: conteneur le plus compact, ou None s'il n'y a aucune plage
+    :rtype: Container
+    """
+    cardinality = sum(last - start + 1 for start, last in zip(starts, lasts))
+    if not cardinality:
+        return None
+
+    kind = encoding(cardinality, len(starts))
+
+    if kind == RUN:
+        return Container(RUN, (array('H', starts), array('H', lasts)), cardinality)
+
+    if kind == ARRAY:
+        lows = array('H')
+        for start, last in zip(starts, lasts):
+            lows.extend(range(start, last + 1))
+        return Container(ARRAY, lows, cardinality)
+
+    return Container(BITMAP, run_bits(starts, lasts), cardinality)
+
+# ---------------------------------------------------------------------------
+def from_positions(lows: list) -> Container:
+    """
+    Encode des positions triées et distinctes d'un bloc.
+
+    :param lows: positions (0 à 65535) triées, sans doublon
+    :return: conteneur le plus compact, ou None si `lows` est vide
+    :rtype: Container
+    """
+    if not lows:
+        return None
+
+    starts, lasts = position_runs(lows)
+    kind = encoding(len(lows), len(starts))
+
+    if kind == ARRAY:
+        return Container(ARRAY, array('H', lows), len(lows))
+
+    if kind == RUN:
+        return Container(RUN, (array('H', starts), array('H', lasts)), len(lows))
+
+    bitmap = bytearray(BITMAP_BYTES)
+    for low in lows:
+        bitmap[low >> 3] |= 1 << (low & 7)
+
+    return Container(BITMAP, int.from_bytes(bitmap, 'little'), len(lows))
+
+# ---------------------------------------------------------------------------
+def to_runs(container: Container) -> tuple:
+    """(débuts, fins) des plages d'un conteneur ARRAY ou RUN."""
+    if container.kind == RUN:
+        return container.data
+
+    return position_runs(container.data)
+
+# ---------------------------------------------------------------------------
+def contains(container: Container, low: int) -> bool:
+    """True si la position `low` est présente dans le conteneur."""
+    if container.kind == BITMAP:
+        return bool(container.data >> low & 1)
+
+    if container.kind == ARRAY:
+        i = bisect_left(container.data, low)
+        return i < len(container.data) and container.data[i] == low
+
+    starts, lasts = container.data
+    i = bisect_right(starts, low) - 1
+    return i >= 0 and low <= lasts[i]
+
+# ===========================================================================
+
+# %% ========================================================================
+# Opérations entre conteneurs
+def union_positions(a: list, b: list) -> list:
+    """Union de deux listes de positions triées, par fusion."""
+    lows = []
+    for low in heapq.merge(a, b):
+        if not lows or low != lows[-1]:
+            lows.append(low)
+
+    return lows
+
+# ---------------------------------------------------------------------------
+def intersect_positions(a: list, b: list) -> list:
+    """Intersection de deux listes de positions triées, par fusion."""
+    lows = []
+    i = j = 0
+
+    while i < len(a) and j < len(b):
+        if a[i] < b[j]:
+            i += 1
+        elif a[i] > b[j]:
+            j += 1
+        else:
+            lows.append(a[i])
+            i += 1
+            j += 1
+
+    return lows
+
+# ---------------------------------------------------------------------------
+def union_runs(a: tuple, b: tuple) -> tuple:
+    """Union de deux suites de plages (débuts, fins), par balayage."""
+    starts, lasts = [], []
+
+    # Plages fusionnées si elles se chevauchent ou sont contiguës
+    for start, last in heapq.merge(zip(*a), zip(*b)):
+        if starts and start <= lasts[-1] + 1:
+            lasts[-1] = max(lasts[-1], last)
+        else:
+            starts.append(start)
+            lasts.append(last)
+
+    return starts, lasts
+
+# ---------------------------------------------------------------------------
+def intersect_runs(a: tuple, b: tuple) -> tuple:
+    """Intersection de deux suites de plages (débuts, fins), par balayage."""
+    (a_starts, a_lasts), (b_starts, b_lasts) = a, b
+    starts, lasts = [], []
+    i = j = 0
+
+    while i < len(a_starts) and j < len(b_starts):
+        start = max(a_starts[i], b_starts[j])
+        last = min(a_lasts[i], b_lasts[j])
+        if start <= last:
+            starts.append(start)
+            lasts.append(last)
+
+        # La plage qui se termine le plus tôt ne peut plus rien recouper
+        if a_lasts[i] < b_lasts[j]:
+            i += 1
+        else:
+            j += 1
+
+    return starts, lasts
+
+# ---------------------------------------------------------------------------
+def union(a: Container, b: Container) -> Container:
+    """
+    Union de deux conteneurs d'un même bloc, selon leurs encodages :
+    fusion des positions (ARRAY | ARRAY), balayage des plages (ARRAY | RUN,
+    RUN | RUN), ou OU binaire avec le bitmap (dès qu'un côté est BITMAP).
+
+    :param a: premier conteneur
+    :param b: second conteneur
+    :return: conteneur le plus compact de l'union
+    :rtype: Container
+    """
+    if KIND_ORDER[a.kind] > KIND_ORDER[b.kind]:
+        a, b = b, a
+
+    if a.kind == BITMAP:
+        return from_bits(a.data | b.data)
+
+    if b.kind == BITMAP:
+        return from_bits(b.data | run_bits(*to_runs(a)))
+
+    if b.kind == ARRAY:
+        return from_positions(union_positions(a.data, b.data))
+
+    return from_runs(*union_runs(to_runs(a), b.data))
+
+# ---------------------------------------------------------------------------
+def intersection(a: Container, b: Container) -> Container:
+    """
+    Intersection de deux conteneurs d'un même bloc, selon leurs encodages :
+    fusion des positions (ARRAY & ARRAY), recherche dans les plages
+    (ARRAY & RUN), test des bits (ARRAY & BITMAP), balayage des plages
+    (RUN & RUN), ou ET binaire (RUN & BITMAP, BITMAP & BITMAP).
+
+    :param a: premier conteneur
+    :param b: second conteneur
+    :return: conteneur le plus compact, ou None si l'intersection est vide
+    :rtype: Container
+    """
+    if KIND_ORDER[a.kind] > KIND_ORDER[b.kind]:
+        a, b = b, a
+
+    if a.kind == BITMAP:
+        return from_bits(a.data & b.data)
+
+    if a.kind == RUN:
+        if b.kind == BITMAP:
+            return from_bits(b.data & run_bits(*a.data))
+        return from_runs(*intersect_runs(a.data, b.data))
+
+    if b.kind == ARRAY:
+        return from_positions(intersect_positions(a.data, b.data))
+
+    if b.kind == RUN:
+        return from_positions([low for low in a.data if contains(b, low)])
+
+    flags = b.data.to_bytes(BITMAP_BYTES, 'little')
+    return from_positions([low for low in a.data if flags[low >> 3] >> (low & 7) & 1])
+
+# ===========================================================================
+
+# %% ========================================================================
+# Bitmap compressé
+class RoaringBitmap:
+    """
+    Ensemble d'IDs compressé par blocs de 2^16 avec :
+    - construction depuis des intervalles ou une liste d'IDs,
+    - appartenance d'un ID et cardinalité,
+    - union (`|`) et intersection (`&`) de deux catalogues.
+    """
+
+    def __init__(self, containers: dict = None):
+        self.containers = containers if containers is not None else {}
+
+    @classmethod
+    def from_intervals(cls, intervals: list) -> "RoaringBitmap":
+        """Construit le bitmap couvrant des intervalles (start, stop)."""
+        runs = {}
+        for start, stop in merge_intervals(intervals):
+            # Découpage de l'intervalle aux frontières des blocs
+            for key in range(start >> BLOCK_BITS, (stop >> BLOCK_BITS) + 1):
+                starts, lasts = runs.setdefault(key, ([], []))
+                starts.append(max(start, key << BLOCK_BITS) & LOW_MASK)
+                lasts.append(min(stop, key << BLOCK_BITS | LOW_MASK) & LOW_MASK)
+
+        return cls({key: from_runs(*block) for key, block in runs.items()})
+
+    @classmethod
+    def from_data(cls, data: list) -> "RoaringBitmap":
+        """Construit le bitmap à partir des lignes "start-stop" de l'input."""
+        return cls.from_intervals([tuple(map(int, line.split("-")))
+                                   for line in data if "-" in line])
+
+    @classmethod
+    def from_ids(cls, ids) -> "RoaringBitmap":
+        """Construit le bitmap d'une liste d'IDs (regroupés par bloc après tri)."""
+        containers = {}
+        for key, block in groupby(sorted(set(ids)), key=lambda id: id >> BLOCK_BITS):
+            containers[key] = from_positions([id & LOW_MASK for id in block])
+
+        return cls(containers)
+
+    @property
+    def total(self) -> int:
+        """Nombre total d'IDs (résultat de la partie 2)."""
+        return sum(container.cardinality for container in self.containers.values())
+
+    @property
+    def encodings(self) -> Counter:
+        """Nombre de conteneurs par encodage."""
+        return Counter(container.kind for container in self.containers.values())
+
+    def __contains__(self, id: int) -> bool:
+        """True si l'ID appartient au bitmap."""
+        container = self.containers.get(id >> BLOCK_BITS)
+        return container is not None and contains(container, id & LOW_MASK)
+
+    def count_fresh(self, ids) -> int:
+        """Nombre d'IDs de la liste présents dans le bitmap (partie 1)."""
+        return sum(id in self for id in ids)
+
+    def __or__(self, other: "RoaringBitmap") -> "RoaringBitmap":
+        containers = dict(self.containers)
+        for key, container in other.containers.items():
+            if key in containers:
+                container = union(containers[key], container)
+            containers[key] = container
+
+        return RoaringBitmap(containers)
+
+    def __and__(self, other: "RoaringBitmap") -> "RoaringBitmap":
+        containers = {}
+        for key in self.containers.keys() & other.containers.keys():
+            container = intersection(self.containers[key], other.containers[key])
+            if container is not None:
+                containers[key] = container
+
+        return RoaringBitmap(containers)
+
+# ===========================================================================
+
+# %%
+if __name__ == "__main__":
+    DATA = get_input(5, False)
+    BITMAP_SET = RoaringBitmap.from_data(DATA)
+    RESULT_1 = BITMAP_SET.count_fresh(int(line) for line in DATA if line and "-" not in line)
+    RESULT_2 = BITMAP_SET.total
+
+    print("\n" + "═" * 60)
+    print("   🔐 Advent of Code 2025 — Day 5 | Bitmap compressé".center(60))
+    print("═" * 60)
+    print(f"Ingrédients frais (partie 1) : \033[96m{RESULT_1}\033[0m")
+    print(f"Ingrédients frais (partie 2) : \033[96m{RESULT_2}\033[0m")
+    print("═" * 60 + "\n")
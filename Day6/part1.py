@@ -21,15 +21,30 @@ Les expressions sont évaluées de gauche à droite conformément aux opérateur
 La somme des résultats de toutes les colonnes constitue la sortie finale.
 
 La logique générale :
-    1. Nettoyage et restructuration des lignes pour obtenir une matrice opérandes × colonnes
+    1. Découpage des lignes d'opérandes en entiers (une seule passe)
     2. Extraction des opérateurs (dernière ligne)
-    3. Construction des expressions colonne par colonne
-    4. Évaluation des expressions
-    5. Addition des résultats
+    3. Réduction de chaque colonne : somme pour '+', produit pour '*'
+    4. Addition des résultats
+
+Une colonne ne contenant qu'un seul opérateur, l'évaluation de gauche à
+droite se ramène à une somme ou un produit : aucune expression n'est
+construite ni évaluée (pas d'`eval`).
 
 .. codeauthor:: Alexandre Condette <alexandre.condette@wanadoo.fr>
 """
 
+# %% ========================================================================
+# Imports
+from math import prod
+# ===========================================================================
+
+# %% ========================================================================
+# Constantes
+OPERATIONS: dict = {
+    '+': sum,     # Addition de tous les opérandes de la colonne
+    '*': prod,    # Produit de tous les opérandes de la colonne
+}
+# ===========================================================================
 
 # %% ========================================================================
 # Lecture de l'entrée
@@ -58,8 +73,8 @@ def solve(lines: list) -> int:
     Fonctionnement :
         - Toutes les lignes sauf la dernière contiennent les opérandes
         - La dernière ligne contient les opérateurs
-        - Chaque colonne est transformée en une expression (string)
-        - L'expression est évaluée via eval()
+        - Chaque colonne est réduite par la somme ou le produit de ses
+          opérandes, selon son opérateur
         - Le résultat est ajouté à une somme globale
 
     :param lines: List[str], lignes de l'entrée
@@ -68,30 +83,19 @@ def solve(lines: list) -> int:
     total_sum = 0
 
     # --- Extraction des opérandes ---
-    # On nettoie les espaces inutiles, on obtient une matrice : lignes × colonnes
-    operands_matrix = []
-    for line in lines[:-1]:
-        cleaned = [token.strip() for token in line.split(' ') if token != '']
-        operands_matrix.append(cleaned)
+    # Chaque ligne est découpée une seule fois : matrice d'entiers lignes × colonnes
+    operands_matrix = [list(map(int, line.split())) for line in lines[:-1]]
 
     # --- Extraction des opérateurs ---
-    operators = [op.strip() for op in lines[-1].split(' ') if op != '']
+    operators = lines[-1].split()
 
     # --- Évaluation colonne par colonne ---
-    nb_columns = len(operators)
-
-    for col in range(nb_columns):
-        expression = ""
-
-        # Construction de l’expression : v0 op v1 op v2 ...
-        for row in range(len(operands_matrix)):
-            expression += operands_matrix[row][col]
-
-            if row != len(operands_matrix) - 1:
-                expression += operators[col]
+    for op, column in zip(operators, zip(*operands_matrix, strict=True), strict=True):
+        if op not in OPERATIONS:
+            raise ValueError(f"Opérateur inconnu : {op}")
 
-        # Évaluation de la colonne et accumulation
-        total_sum += eval(expression)
+        # Réduction de la colonne et accumulation
+        total_sum += OPERATIONS[op](column)
 
     return total_sum
 
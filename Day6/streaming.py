@@ -0,0 +1,227 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Advent Of Code 2025
+===================
+Day : 6
+Part : 1 & 2 (lecture en flux)
+
+Ce script évalue des feuilles de calcul de quelques lignes mais de très
+grande largeur, sans charger les lignes en mémoire :
+    - le fichier est projeté en mémoire (mmap) et le début / la fin de
+      chaque ligne sont repérés une seule fois,
+    - les colonnes sont parcourues de gauche à droite par fenêtres de
+      `window` colonnes, lues ligne par ligne dans le mmap et complétées
+      par des espaces au-delà de la fin d'une ligne,
+    - dans chaque fenêtre, les colonnes vides sont détectées et les nombres
+      verticaux (partie 2) décodés de façon vectorisée,
+    - le résultat d'un problème (parties 1 et 2) est émis dès que sa
+      colonne séparatrice est lue.
+
+La mémoire est bornée par la taille d'une fenêtre (plus la largeur d'un
+problème à cheval sur deux fenêtres), et non par la largeur des lignes.
+
+Les opérateurs sont attribués aux problèmes de gauche à droite, dans leur
+ordre d'apparition sur la dernière ligne : les résultats sont ceux de
+`part1.py` et `part2.py` lorsque chaque problème a son opérateur.
+
+.. codeauthor:: Alexandre Condette <alexandre.condette@wanadoo.fr>
+"""
+
+# %% ========================================================================
+# Imports
+import mmap
+from collections import deque
+from math import prod
+
+import numpy as np
+# ===========================================================================
+
+# %% ========================================================================
+# Constantes
+WINDOW: int = 1 << 20         # Colonnes lues par fenêtre
+SPACE: int = ord(" ")         # Case vide
+ZERO: int = ord("0")          # Code du chiffre 0
+INT64_DIGITS: int = 18        # Nombre de chiffres représentables en int64
+# ===========================================================================
+
+# %% ========================================================================
+# Lecture par fenêtres
+def row_offsets(buffer: mmap.mmap) -> list:
+    """
+    Repère le début et la fin (sans fin de ligne) de chaque ligne.
+
+    :param buffer: fichier projeté en mémoire
+    :return: liste de tuples (début, fin) ; les lignes vides finales
+             sont ignorées
+    :rtype: list
+    """
+    rows = []
+    pos, size = 0, len(buffer)
+
+    while pos < size:
+        end = buffer.find(b"\n", pos)
+        end = size if end == -1 else end
+        stop = end - int(end > pos and buffer[end - 1] == ord("\r"))
+        rows.append((pos, stop))
+        pos = end + 1
+
+    while rows and rows[-1][0] == rows[-1][1]:
+        rows.pop()
+
+    return rows
+
+# ---------------------------------------------------------------------------
+def read_window(buffer: mmap.mmap, rows: list, c0: int, c1: int) -> np.ndarray:
+    """
+    Lit les colonnes [c0, c1) de toutes les lignes.
+
+    :param buffer: fichier projeté en mémoire
+    :param rows: (début, fin) de chaque ligne
+    :param c0: première colonne de la fenêtre
+    :param c1: colonne suivant la fin de la fenêtre
+    :return: matrice uint8 (lignes × colonnes), complétée par des espaces
+    :rtype: np.ndarray
+    """
+    window = np.full((len(rows), c1 - c0), SPACE, dtype=np.uint8)
+
+    for y, (start, stop) in enumerate(rows):
+        lo, hi = start + c0, min(start + c1, stop)
+        if lo < hi:
+            window[y, :hi - lo] = np.frombuffer(buffer[lo:hi], dtype=np.uint8)
+
+    return window
+
+# ---------------------------------------------------------------------------
+def vertical_numbers(digits: np.ndarray) -> list:
+    """
+    Décode le nombre vertical de chaque colonne d'une fenêtre (partie 2).
+
+    :param digits: matrice uint8 des lignes de chiffres de la fenêtre
+    :return: nombre de chaque colonne (0 pour une colonne vide)
+    :rtype: list
+    """
+    present = digits != SPACE
+    values = digits.astype(np.int64) - ZERO
+
+    if (present & ((values < 0) | (values > 9))).any():
+        raise ValueError("Caractère non numérique dans la feuille")
+
+    # Les chiffres d'une colonne doivent être consécutifs (un seul nombre)
+    starts = present.copy()
+    starts[1:] &= ~present[:-1]
+    if (starts.sum(axis=0) > 1).any():
+        raise ValueError("Colonne contenant plusieurs nombres")
+
+    dtype = np.int64 if digits.shape[0] <= INT64_DIGITS else object
+    numbers = np.zeros(digits.shape[1], dtype=dtype)
+    for row_present, row_values in zip(present, values):
+        numbers = np.where(row_present, numbers * 10 + row_values, numbers)
+
+    return numbers.tolist()
+
+# ===========================================================================
+
+# %% ========================================================================
+# Résolution
+def evaluate(op: str, lines: list, columns: list) -> tuple:
+    """
+    Évalue un problème selon les deux lectures.
+
+    :param op: opérateur du problème
+    :param lines: octets du problème, ligne par ligne (partie 1)
+    :param columns: nombres verticaux du problème (partie 2)
+    :return: (résultat partie 1, résultat partie 2)
+    :rtype: tuple
+    """
+    horizontal = [int(line) for line in lines if line.strip()]
+
+    if op == '+':
+        return sum(horizontal), sum(columns)
+    if op == '*':
+        return prod(horizontal), prod(columns)
+
+    raise ValueError(f"Opérateur inconnu : {op}")
+
+# ---------------------------------------------------------------------------
+def iter_problems(path: str, window: int = WINDOW):
+    """
+    Parcourt la feuille par fenêtres de colonnes et émet le résultat de
+    chaque problème dès sa colonne séparatrice.
+
+    :param path: chemin du fichier de la feuille
+    :param window: nombre de colonnes lues par fenêtre
+    :return: générateur de tuples (résultat partie 1, résultat partie 2)
+    """
+    with open(path, 'rb') as f, \
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+        rows = row_offsets(buffer)
+        width = max((stop - start for start, stop in rows), default=0)
+
+        operators = deque()                        # opérateurs lus, non attribués
+        lines = [bytearray() for _ in rows[:-1]]   # problème courant (partie 1)
+        columns = []                               # problème courant (partie 2)
+
+        for c0 in range(0, width, window):
+            block = read_window(buffer, rows, c0, min(c0 + window, width))
+            digits, operator_row = block[:-1], block[-1]
+
+            operators.extend(bytes(operator_row).replace(b" ", b"").decode('ascii'))
+            numbers = vertical_numbers(digits)
+            blank = ~(digits != SPACE).any(axis=0)
+
+            # Segments de la fenêtre entre deux colonnes séparatrices
+            lo = 0
+            for sep in np.flatnonzero(blank).tolist() + [block.shape[1]]:
+                for line, row in zip(lines, digits):
+                    line += row[lo:sep].tobytes()
+                columns.extend(numbers[lo:sep])
+
+                if sep < block.shape[1]:
+                    yield evaluate(next_operator(operators), lines, columns)
+                    lines = [bytearray() for _ in lines]
+                    columns = []
+                lo = sep + 1
+
+        # Dernier problème : fin de la feuille
+        yield evaluate(next_operator(operators), lines, columns)
+
+# ---------------------------------------------------------------------------
+def next_operator(operators: deque) -> str:
+    """Opérateur du prochain problème, dans l'ordre de la dernière ligne."""
+    if not operators:
+        raise ValueError("Opérateur manquant pour un problème")
+
+    return operators.popleft()
+
+# ---------------------------------------------------------------------------
+def solve(path: str, window: int = WINDOW) -> tuple:
+    """
+    Calcule les grands totaux des parties 1 et 2 en une seule passe.
+
+    :param path: chemin du fichier de la feuille
+    :param window: nombre de colonnes lues par fenêtre
+    :return: (grand total partie 1, grand total partie 2)
+    :rtype: tuple
+    """
+    total_1 = total_2 = 0
+
+    for result_1, result_2 in iter_problems(path, window):
+        total_1 += result_1
+        total_2 += result_2
+
+    return total_1, total_2
+
+# ===========================================================================
+
+# %%
+if __name__ == "__main__":
+    RESULT_1, RESULT_2 = solve("./Day6/input.txt")
+
+    print("\n" + "═" * 60)
+    print("   🔐 Advent of Code 2025 — Day 6 | Flux".center(60))
+    print("═" * 60)
+    print(f"Grand Total (partie 1) : \033[96m{RESULT_1}\033[0m")
+    print(f"Grand Total (partie 2) : \033[96m{RESULT_2}\033[0m")
+    print("═" * 60 + "\n")
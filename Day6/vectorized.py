@@ -0,0 +1,152 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Advent Of Code 2025
+===================
+Day : 6
+Part : 2 (vectorisé)
+
+Ce script résout la partie 2 en traitant la feuille de calcul comme une
+matrice d'octets (uint8) de largeur fixe, complétée par des espaces :
+    - les colonnes séparatrices (entièrement vides) sont détectées en un
+      seul test vectorisé sur toute la matrice,
+    - les nombres verticaux de toutes les colonnes sont décodés en même
+      temps, ligne par ligne, par poids des chiffres (n = 10 * n + d),
+    - seuls les blocs (un par problème) sont parcourus en Python, pour
+      appliquer leur opérateur.
+
+La sémantique est celle de `part2.py` : les blocs sont délimités par les
+colonnes vides et reçoivent, de droite à gauche, les opérateurs de la
+dernière ligne lus de droite à gauche.
+
+.. codeauthor:: Alexandre Condette <alexandre.condette@wanadoo.fr>
+"""
+
+# %% ========================================================================
+# Imports
+from math import prod
+
+import numpy as np
+# ===========================================================================
+
+# %% ========================================================================
+# Constantes
+SPACE: int = ord(" ")         # Case vide
+ZERO: int = ord("0")          # Code du chiffre 0
+INT64_DIGITS: int = 18        # Nombre de chiffres représentables en int64
+# ===========================================================================
+
+# %% ========================================================================
+# Input data
+def get_input(day: int = 1, example: bool = False) -> list:
+    """
+    Lit le fichier d'entrée pour le jour donné.
+
+    :param day: numéro du jour AoC
+    :param example: True pour example.txt, False pour input.txt
+    :return: liste des lignes du fichier
+    """
+    filename = 'example.txt' if example else 'input.txt'
+    with open(f"./Day{day}/{filename}", 'r', encoding='utf-8') as f:
+        return [line.rstrip('\n') for line in f]
+
+# ===========================================================================
+
+# %% ========================================================================
+# Matrice d'octets
+def load_matrix(data: list) -> tuple:
+    """
+    Charge les lignes de chiffres dans une matrice uint8 de largeur fixe.
+
+    :param data: lignes du fichier AoC
+    :return: (matrice des lignes de chiffres complétée par des espaces,
+              liste des opérateurs de gauche à droite)
+    :rtype: tuple
+    """
+    rows = [line.encode('ascii') for line in data[:-1]]
+    operator_row = data[-1]
+
+    width = max(len(row) for row in rows + [operator_row])
+    matrix = np.full((len(rows), width), SPACE, dtype=np.uint8)
+    for y, row in enumerate(rows):
+        matrix[y, :len(row)] = np.frombuffer(row, dtype=np.uint8)
+
+    return matrix, [c for c in operator_row if c != " "]
+
+# ---------------------------------------------------------------------------
+def decode_columns(matrix: np.ndarray) -> tuple:
+    """
+    Décode le nombre vertical de chaque colonne.
+
+    :param matrix: matrice uint8 des lignes de chiffres
+    :return: (nombre de chaque colonne, masque des colonnes vides)
+    :rtype: tuple
+    """
+    present = matrix != SPACE
+    digits = matrix.astype(np.int64) - ZERO
+
+    if (present & ((digits < 0) | (digits > 9))).any():
+        raise ValueError("Caractère non numérique dans la feuille")
+
+    # Les chiffres d'une colonne doivent être consécutifs (un seul nombre)
+    starts = present.copy()
+    starts[1:] &= ~present[:-1]
+    if (starts.sum(axis=0) > 1).any():
+        raise ValueError("Colonne contenant plusieurs nombres")
+
+    # Au-delà de 18 chiffres, les nombres sont décodés en entiers Python
+    dtype = np.int64 if matrix.shape[0] <= INT64_DIGITS else object
+    numbers = np.zeros(matrix.shape[1], dtype=dtype)
+    for row_present, row_digits in zip(present, digits):
+        numbers = np.where(row_present, numbers * 10 + row_digits, numbers)
+
+    return numbers, ~present.any(axis=0)
+
+# ===========================================================================
+
+# %% ========================================================================
+# Résolution
+def solve(data: list) -> int:
+    """
+    Résout la partie 2 : évaluation des problèmes lus verticalement.
+
+    :param data: lignes du fichier AoC
+    :return: total des résultats des blocs
+    """
+    matrix, operators = load_matrix(data)
+    numbers, blank = decode_columns(matrix)
+
+    # Bornes des blocs : colonnes vides, et bords de la feuille
+    bounds = [-1] + np.flatnonzero(blank).tolist() + [matrix.shape[1]]
+    blocks = len(bounds) - 1
+    if blocks > len(operators):
+        raise ValueError(f"{blocks} problèmes pour {len(operators)} opérateurs")
+
+    # Les derniers opérateurs sont attribués aux blocs, dans l'ordre
+    numbers = numbers.tolist()
+    total = 0
+
+    for op, lo, hi in zip(operators[len(operators) - blocks:], bounds, bounds[1:]):
+        block = numbers[lo + 1:hi]
+
+        if op == '+':
+            total += sum(block)
+        elif op == '*':
+            total += prod(block)
+        else:
+            raise ValueError(f"Opérateur inconnu : {op}")
+
+    return total
+
+# ===========================================================================
+
+# %%
+if __name__ == "__main__":
+    RESULT = solve(get_input(6, False))
+
+    print("\n" + "═" * 60)
+    print("   🔐 Advent of Code 2025 — Day 6 | Vectorisé".center(60))
+    print("═" * 60)
+    print(f"Grand Total : \033[96m{RESULT}\033[0m")
+    print("═" * 60 + "\n")
@@ -15,4 +15,62 @@ def test_day1_part1_example():
 
 def test_day1_part2_example():
     result = part2.solve(INPUT2)
-    assert result == 6
\ No newline at end of file
+    assert result == 6
+
+def test_day1_vectorized_example():
+    pytest.importorskip("numpy")
+    from Day1 import vectorized
+
+    data = vectorized.get_input(1, True)
+    assert vectorized.solve_part1(data) == 3
+    assert vectorized.solve_part2(data) == 6
+
+
+def test_day1_vectorized_matches_solve():
+    pytest.importorskip("numpy")
+    from Day1 import vectorized
+
+    lines = ["R50", "L100", "R250", "L1", "R1", "L399", "R0", "L50", "R1000"]
+    raw = ("\r\n".join(lines)).encode()
+    assert vectorized.solve_part1(raw) == part1.solve(lines)
+    assert vectorized.solve_part2(raw) == part2.solve(lines)
+
+
+def test_day1_parallel_summaries_compose():
+    from Day1 import parallel
+
+    lines = [line.strip() for line in INPUT]
+    movements = [int(line[1:]) * parallel.SIGNS[line[0]] for line in lines]
+    total = parallel.combine(parallel.summarize(movements[:4]),
+                             parallel.summarize(movements[4:]))
+    assert total.hits[parallel.START] == 3
+    assert total.passes[parallel.START] == 6
+
+
+def test_day1_parallel_solve():
+    from Day1 import parallel
+
+    result = parallel.solve("./Day1/example.txt", workers=2, chunk_size=8)
+    assert result == (3, 6)
+
+
+def test_day1_tracker_resume(tmp_path):
+    from Day1 import tracker
+
+    dial = tracker.DialTracker()
+    dial.extend(INPUT[:5])
+    dial.save(tmp_path / "dial.json")
+
+    resumed = tracker.DialTracker.load(tmp_path / "dial.json")
+    for rotation in INPUT[5:]:
+        resumed.rotate(rotation)
+
+    assert resumed.steps == len(INPUT)
+    assert resumed.part1 == 3
+    assert resumed.part2 == 6
+
+
+def test_day1_streaming_example():
+    from Day1 import streaming
+
+    assert streaming.solve("./Day1/example.txt") == (3, 6)
@@ -16,3 +16,55 @@ def test_day2_part1_example():
 def test_day2_part2_example():
     result = part2.solve(INPUT2, 2)
     assert result == 4174379265
+
+
+def test_day2_part2_closed_form_matches_bruteforce():
+    for n in (2, 3, 4):
+        for start, stop in ((1, 5000), (95, 1115), (99990, 112000)):
+            expected = [x for x in range(start, stop + 1)
+                        if part2.is_repeated_pattern(x, n)]
+            assert part2.repeated_pattern_range(start, stop, n) == \
+                (sum(expected), len(expected))
+
+
+def test_day2_index_matches_solve(tmp_path):
+    from Day2 import index
+
+    doubled = index.RepeatedPatternIndex.build(10, doubled=True)
+    assert doubled.query_ranges(INPUT.strip())[0] == 1227775554
+
+    repeated = index.RepeatedPatternIndex.build(10, n=2)
+    repeated.save(tmp_path / "index.bin")
+    loaded = index.RepeatedPatternIndex.load(tmp_path / "index.bin")
+    assert loaded.query_ranges(INPUT2.strip())[0] == 4174379265
+    assert loaded.query(95, 115) == (99 + 111, 2)
+
+
+def test_day2_kernel_matches_is_repeated_pattern():
+    pytest.importorskip("numpy")
+    from Day2 import kernel
+
+    assert kernel.solve(INPUT2, 2) == 4174379265
+    for n in (2, 3):
+        expected = [x for x in range(999000, 1001500)
+                    if part2.is_repeated_pattern(x, n)]
+        assert kernel.scan_range(999000, 1001499, n=n) == \
+            (sum(expected), len(expected))
+
+
+def test_day2_kernel_custom_predicate():
+    pytest.importorskip("numpy")
+    from Day2 import kernel
+
+    # Palindromes à 3 chiffres : 101, 111, ..., 191
+    palindrome = lambda digits: digits[0] == digits[-1]
+    assert kernel.scan_range(100, 199, palindrome) == \
+        (sum(range(101, 200, 10)), 10)
+
+
+def test_day2_merge_counts_overlaps_once():
+    data = "11-22,15-99,95-115"
+    assert part1.solve(INPUT, merge=True) == 1227775554
+    assert part2.solve(INPUT2, 2, merge=True) == 4174379265
+    assert part1.solve(data, merge=True) == sum(range(11, 100, 11))
+    assert part2.solve(data, 2, merge=True) == sum(range(11, 100, 11)) + 111
@@ -16,3 +16,43 @@ def test_day3_part1_example():
 def test_day3_part2_example():
     result = part2.solve(INPUT2)
     assert result == 3121910778619
+
+
+def test_day3_vectorized_part1():
+    pytest.importorskip("numpy")
+    from Day3 import vectorized
+
+    assert vectorized.solve(vectorized.get_input(3, True)) == 357
+
+    # Lignes de longueurs différentes → regroupement par longueur
+    lines = ["91", "123", "818181911112111", "5555"]
+    raw = "\r\n".join(lines).encode()
+    assert vectorized.solve(raw) == part1.solve(lines)
+
+    # Fichier CRLF sans fin de ligne finale
+    assert vectorized.solve(b"48\r\n148") == part1.solve(["48", "148"]) == 96
+
+
+def test_day3_part2_all_lengths():
+    digits = [int(d) for d in "818181911112111"]
+    values = part2.max_subsequences(digits)
+    assert len(values) == len(digits)
+    assert values[1] == 92
+    assert values[11] == 888911112111
+    assert values == [part2.max_subsequence_as_number(digits, k)
+                      for k in range(1, len(digits) + 1)]
+
+    # Digits égaux : même départage que la pile monotone
+    digits = [int(d) for d in "99819981"]
+    assert sorted(part2.deletion_order(digits)) == list(range(len(digits)))
+    assert part2.max_subsequences(digits, [3, 20, 1]) == \
+        [part2.max_subsequence_as_number(digits, k) for k in (3, 8, 1)]
+
+
+def test_day3_part2_huge_line():
+    line = b"987654321" * 1000
+    digits = part2.max_subsequence_buffer(line, 5000)
+    assert len(digits) == 5000
+    assert part2.digits_to_int(digits) == \
+        part2.max_subsequence_as_number([d - ord("0") for d in line], 5000)
+    assert part2.solve_stream("./Day3/example.txt") == 3121910778619
@@ -16,3 +16,46 @@ def test_day4_part1_example():
 def test_day4_part2_example():
     result = part2.solve(INPUT2)
     assert result == 43
+
+
+def test_day4_vectorized_part1():
+    pytest.importorskip("numpy")
+    from Day4 import vectorized
+
+    assert vectorized.solve(vectorized.get_input(4, True)) == 13
+    assert vectorized.solve(INPUT) == 13
+
+
+def test_day4_bitboard():
+    from Day4 import bitboard
+
+    assert bitboard.solve_part1(INPUT) == 13
+    assert bitboard.solve_part2(INPUT2) == 43
+
+
+def test_day4_tiled_bands():
+    pytest.importorskip("numpy")
+    from Day4 import tiled
+
+    assert tiled.solve_part1("./Day4/example.txt", band_rows=3) == 13
+    assert tiled.solve_part2("./Day4/example.txt", band_rows=3) == 43
+
+
+def test_day4_part2_removal_rounds(tmp_path):
+    rounds = part2.RemovalRounds.from_grid(INPUT2)
+    assert rounds.total_removed == 43
+    assert rounds.per_round[0] == part1.solve(INPUT)
+    assert rounds.removed_after(2) == 25
+    assert rounds.round_of(0, 0) == part2.NO_ROLL
+
+    rounds.save(tmp_path / "rounds.bin")
+    loaded = part2.RemovalRounds.load(tmp_path / "rounds.bin")
+    assert loaded.per_round == rounds.per_round
+    assert loaded.survivors() == rounds.survivors()
+
+
+def test_day4_parallel_bands():
+    pytest.importorskip("numpy")
+    from Day4 import parallel
+
+    assert parallel.solve("./Day4/example.txt", workers=2, band_rows=3) == 13
@@ -16,3 +16,104 @@ def test_day5_part1_example():
 def test_day5_part2_example():
     result = part2.solve(INPUT2)
     assert result == 14
+
+
+def test_day5_part1_count_fresh_fallback():
+    intervals = [(3, 5), (10, 14), (16, 20), (12, 18)]
+    ids = [1, 5, 8, 11, 17, 32]
+    expected = [False, True, False, True, True, False]
+
+    fresh, mask = part1.count_fresh(ids, intervals, return_mask=True, use_numpy=False)
+    assert (fresh, mask) == (3, expected)
+
+    fresh, mask = part1.count_fresh(ids, intervals, return_mask=True)
+    assert (fresh, list(mask)) == (3, expected)
+
+    # Itérable quelconque (générateur)
+    assert part1.count_fresh((id for id in ids), intervals) == 3
+    assert part1.count_fresh((id for id in ids), intervals, use_numpy=False) == 3
+
+
+def test_day5_persistent_index(tmp_path):
+    from Day5 import index
+
+    path = tmp_path / "index.bin"
+    assert index.build_index(INPUT, path) == 2
+
+    with index.IntervalIndex(path, verify=True) as intervals:
+        assert intervals.total == 14
+        assert [intervals.contains(id) for id in (1, 5, 8, 11, 17, 32)] == \
+            [False, True, False, True, True, False]
+        assert intervals.count_fresh(4, 12) == 5
+        assert intervals.count_fresh(12, 4) == 0
+
+
+def test_day5_external_merge():
+    from Day5 import external
+
+    assert external.solve("./Day5/example.txt", run_size=2) == 14
+
+
+def test_day5_dynamic_interval_set():
+    from Day5 import dynamic
+
+    intervals = dynamic.IntervalSet.from_data(INPUT)
+    assert intervals.total == 14
+    assert [id in intervals for id in (1, 5, 8, 11, 17, 32)] == \
+        [False, True, False, True, True, False]
+
+    intervals.remove(12, 18)
+    assert intervals.total == 13
+    assert 15 not in intervals
+
+    intervals.add(21, 30)
+    assert intervals.total == 23
+
+    with pytest.raises(ValueError):
+        intervals.remove(12, 18)
+
+
+def test_day5_roaring_bitmap():
+    from Day5 import roaring
+
+    fresh = roaring.RoaringBitmap.from_data(INPUT)
+    assert fresh.total == 14
+    assert fresh.count_fresh([1, 5, 8, 11, 17, 32]) == 3
+
+    # Un bloc par encodage : plage, positions éparses, bitmap dense
+    catalog = roaring.RoaringBitmap.from_intervals(
+        [(0, 65535)] + [(65536 + 2 * i, 65536 + 2 * i) for i in range(100)]
+        + [(131072 + 2 * i, 131072 + 2 * i) for i in range(10000)])
+    assert catalog.encodings == {"run": 1, "array": 1, "bitmap": 1}
+    assert catalog.total == 65536 + 100 + 10000
+    assert 65538 in catalog and 65539 not in catalog and 131072 + 19998 in catalog
+
+    ids = roaring.RoaringBitmap.from_ids([4, 5, 65538, 65539, 131074, 200000])
+    assert (catalog & ids).total == 4
+    assert (catalog & ids).encodings == {"array": 3}
+    assert (catalog | ids).total == catalog.total + 2
+
+
+def test_day5_external_merge_bounded_fan_in(tmp_path, monkeypatch):
+    from Day5 import external
+
+    # 1000 runs d'un intervalle, fusionnés 8 par 8
+    path = tmp_path / "catalog.txt"
+    path.write_text("\n".join(f"{3 * i}-{3 * i + 1}" for i in reversed(range(1000))) + "\n")
+
+    # Compte les runs ouverts simultanément en lecture
+    read_run = external.read_run
+    opened = {"current": 0, "max": 0}
+
+    def counting_read_run(run, block_pairs):
+        opened["current"] += 1
+        opened["max"] = max(opened["max"], opened["current"])
+        try:
+            yield from read_run(run, block_pairs)
+        finally:
+            opened["current"] -= 1
+
+    monkeypatch.setattr(external, "read_run", counting_read_run)
+
+    assert external.solve(path, run_size=1, fan_in=8) == 2000
+    assert 2 <= opened["max"] <= 8
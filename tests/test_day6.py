@@ -16,3 +16,30 @@ def test_day6_part1_example():
 def test_day6_part2_example():
     result = part2.solve(INPUT2)
     assert result == 3263827
+
+
+def test_day6_part1_unknown_operator():
+    with pytest.raises(ValueError):
+        part1.solve(["1 2", "3 4", "+ -"])
+
+
+def test_day6_vectorized_example():
+    pytest.importorskip("numpy")
+    from Day6 import vectorized
+
+    assert vectorized.solve(INPUT2) == 3263827
+
+    # Colonne vide finale : bloc vide évalué comme dans la partie 2
+    data = ["12 3 ", " 4 56", "+  * *"]
+    assert vectorized.solve(data) == part2.solve(data)
+
+
+def test_day6_streaming_example():
+    pytest.importorskip("numpy")
+    from Day6 import streaming
+
+    assert streaming.solve("./Day6/example.txt") == (4277556, 3263827)
+
+    # Fenêtres plus étroites qu'un problème
+    results = list(streaming.iter_problems("./Day6/example.txt", window=2))
+    assert results == [(33210, 8544), (490, 625), (4243455, 3253600), (401, 1058)]